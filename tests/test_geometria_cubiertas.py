@@ -0,0 +1,8 @@
+from zonda.cirsoc.geometria.cubiertas import CubiertaMansarda, cubierta
+
+
+def test_area_mansarda():
+    mansarda = cubierta('mansarda', ancho=12, longitud=20, altura_alero=5,
+                        altura_cumbrera=8, ancho_central=4)
+    assert isinstance(mansarda, CubiertaMansarda)
+    assert mansarda.area == 280.0
@@ -0,0 +1,10 @@
+from zonda.cirsoc.geometria.edificio import edificio
+
+
+def test_cerramiento_condicion_3_pared_derecha():
+    # Aberturas en el orden frontal, izquierda, trasera, derecha y cubierta.
+    # Solo la pared derecha supera el mínimo entre 0,4 m2 y el 1% de su área.
+    geometria = edificio(12, 20, 0, 5, 'plana', aberturas=[0, 0, 0, 1, 0])
+    condicion = geometria.cerramiento_condicion_3
+    assert len(condicion) == 4
+    assert condicion == (False, False, False, True)
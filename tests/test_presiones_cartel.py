@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from zonda.cirsoc import estructuras
+from zonda.cirsoc.presiones.cartel import Cartel
+
+
+def _cartel(altura_superior, **kwargs):
+    argumentos = dict(
+        profundidad=0.3, ancho=6, altura_inferior=2.5,
+        altura_superior=altura_superior,
+        alturas_personalizadas=[0.5, 3, 4.2, 7, altura_superior],
+        es_parapeto=False, velocidad=45, categoria_exp='C', categoria='II',
+        factor_g_simplificado=True, flexibilidad='rigida',
+        considerar_topografia=False
+    )
+    argumentos.update(kwargs)
+    return estructuras.Cartel(**argumentos)
+
+
+def test_valores_lote_igual_a_instancias():
+    topografia = dict(
+        considerar_topografia=True, tipo_terreno='escarpa bidimensional',
+        altura_terreno=30, distancia_cresta=50,
+        distancia_barlovento_sotavento=20, direccion='barlovento'
+    )
+    carteles = [
+        _cartel(altura, **topografia) for altura in (8.3, 9.0, 12.0)
+    ]
+    presiones = [cartel.presiones for cartel in carteles]
+    valores = Cartel.valores_lote(
+        [p.alturas for p in presiones], 'II', 45, carteles[0].rafaga,
+        [p.factor_topografico for p in presiones],
+        [cartel.cf() for cartel in carteles]
+    )
+    np.testing.assert_array_equal(valores, [p() for p in presiones])
+
+
+def test_valores_lote_cf_unico():
+    cartel = _cartel(8.3)
+    presiones = cartel.presiones
+    valores = Cartel.valores_lote(
+        [presiones.alturas], 'II', 45, cartel.rafaga, 1.0, cartel.cf()
+    )
+    np.testing.assert_array_equal(valores[0], presiones())
+
+
+def test_valores_lote_alturas_de_una_dimension():
+    cartel = _cartel(8.3)
+    with pytest.raises(ValueError):
+        Cartel.valores_lote([1, 2, 5], 'II', 45, cartel.rafaga, 1.0,
+                            [1.2, 1.5])
+
+
+def test_valores_lote_cantidad_de_cf():
+    cartel = _cartel(8.3)
+    with pytest.raises(ValueError):
+        Cartel.valores_lote([[1, 2, 5], [1, 2, 5]], 'II', 45, cartel.rafaga,
+                            1.0, [1.2, 1.5, 1.7])
+
+
+def test_valores_lote_forma_factor_topografico():
+    cartel = _cartel(8.3)
+    with pytest.raises(ValueError):
+        Cartel.valores_lote([[1, 2, 5], [1, 2, 5]], 'II', 45, cartel.rafaga,
+                            [1.0, 1.1], [1.2, 1.5])
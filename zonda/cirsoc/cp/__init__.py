@@ -17,4 +17,7 @@
 
 from .edificio import Edificio
 from .cartel import Cartel
-from .aisladas import cubierta_aislada
+from .aisladas import (
+    cubierta_aislada, cubierta_aislada_lote, cubierta_dos_aguas_lote,
+    cubierta_un_agua_lote
+)
@@ -15,130 +15,284 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections import namedtuple
+from functools import cached_property, lru_cache
 import numpy as np
-from cached_property import cached_property
 from zonda.cirsoc import excepciones
+from .utilidades import solo_lectura
+
+
+# Tabla I.2 - Cubiertas aisladas a dos aguas. Los mínimos se escriben con los
+# valores para relación de bloqueo 0 y 1 en cada par.
+_ANGULOS_DOS_AGUAS = np.array(
+    (-20, -15, -10, -5, 5, 10, 15, 20, 25, 30), dtype=np.float64
+)
+# Filas: global, zona a, zona b, zona c, zona d.
+_MAX_DOS_AGUAS = np.array((
+    (0.7, 0.5, 0.4, 0.3, 0.3, 0.4, 0.4, 0.6, 0.7, 0.9),
+    (0.8, 0.6, 0.6, 0.5, 0.6, 0.7, 0.9, 1.1, 1.2, 1.3),
+    (1.6, 1.5, 1.4, 1.5, 1.8, 1.8, 1.9, 1.9, 1.9, 1.9),
+    (0.6, 0.7, 0.8, 0.8, 1.3, 1.4, 1.4, 1.5, 1.6, 1.6),
+    (1.7, 1.4, 1.1, 0.8, 0.4, 0.4, 0.4, 0.4, 0.5, 0.7)
+), dtype=np.float64)
+_MIN_DOS_AGUAS = np.array((
+    ((-0.7, -1.5), (-0.6, -1.5), (-0.6, -1.4), (-0.5, -1.4), (-0.6, -1.2),
+     (-0.7, -1.2), (-0.8, -1.2), (-0.9, -1.2), (-1.0, -1.2), (-1.0, -1.2)),
+    ((-0.9, -1.5), (-0.8, -1.5), (-0.8, -1.4), (-0.5, -1.4), (-0.6, -1.2),
+     (-0.7, -1.2), (-0.9, -1.2), (-1.2, -1.2), (-1.4, -1.2), (-1.4, -1.2)),
+    ((-1.3, -2.4), (-1.3, -2.7), (-1.3, -2.5), (-1.3, -2.3), (-1.4, -2.0),
+     (-1.5, -1.8), (-1.7, -1.6), (-1.8, -1.5), (-1.9, -1.4), (-1.9, -1.3)),
+    ((-1.6, -2.4), (-1.6, -2.6), (-1.5, -2.5), (-1.6, -2.4), (-1.4, -1.8),
+     (-1.4, -1.6), (-1.4, -1.3), (-1.4, -1.2), (-1.4, -1.1), (-1.4, -1.1)),
+    ((-0.6, -1.2), (-0.6, -1.2), (-0.6, -1.2), (-0.6, -1.2), (-1.1, -1.5),
+     (-1.4, -1.6), (-1.8, -1.7), (-2.0, -1.7), (-2.0, -1.6), (-2.0, -1.6))
+), dtype=np.float64)
+
+# Tabla I.1 - Cubiertas aisladas a un agua. Filas: global, zona a, zona b,
+# zona c. Las tablas de mínimos se indexan primero según _POSICIONES_BLOQUEO.
+_POSICIONES_BLOQUEO = {'alero mas bajo': 0, 'alero mas alto': 1}
+_ANGULOS_UN_AGUA = np.array((0, 5, 10, 15, 20, 25, 30), dtype=np.float64)
+_MAX_UN_AGUA = np.array((
+    (0.2, 0.4, 0.5, 0.7, 0.8, 1, 1.2),
+    (0.5, 0.8, 1.2, 1.4, 1.7, 2, 2.2),
+    (1.8, 2.1, 2.4, 2.7, 2.9, 3.1, 3.2),
+    (1.1, 1.3, 1.6, 1.8, 2.1, 2.3, 2.4)
+), dtype=np.float64)
+_MIN_UN_AGUA = np.array((
+    (  # alero mas bajo
+        ((-0.5, -1.2), (-0.7, -1.4), (-0.9, -1.4), (-1.1, -1.5),
+         (-1.3, -1.5), (-1.6, -1.4), (-1.8, -1.4)),
+        ((-0.6, -1.3), (-1.1, -1.4), (-1.5, -1.4), (-1.8, -1.5),
+         (-2.2, -1.5), (-2.6, -1.4), (-3.0, -1.4)),
+        ((-1.3, -1.8), (-1.7, -2.6), (-2.0, -2.6), (-2.4, -2.9),
+         (-2.8, -2.9), (-3.2, -2.5), (-3.8, -2.0)),
+        ((-1.4, -2.2), (-1.8, -2.6), (-2.1, -2.7), (-2.5, -2.8),
+         (-2.9, -2.7), (-3.2, -2.5), (-3.6, -2.3))
+    ),
+    (  # alero mas alto
+        ((-0.5, -1.2), (-0.7, -1.2), (-0.9, -1.1), (-1.1, -1),
+         (-1.3, -0.9), (-1.6, -0.8), (-1.8, -0.8)),
+        ((-0.6, -1.3), (-1.1, -1.2), (-1.5, -1.1), (-1.8, -1),
+         (-2.2, -0.9), (-2.6, -0.8), (-3.0, -0.8)),
+        ((-1.3, -1.8), (-1.7, -2.6), (-2.0, -2.6), (-2.4, -2.9),
+         (-2.8, -2.9), (-3.2, -2.5), (-3.8, -2.0)),
+        ((-1.4, -2.2), (-1.8, -2.1), (-2.1, -1.8), (-2.5, -1.6),
+         (-2.9, -1.5), (-3.2, -1.4), (-3.6, -1.2))
+    )
+), dtype=np.float64)
+
+# Los mínimos se guardan con el eje de relación de bloqueo antes del eje de
+# ángulos, así los valores para bloqueo 0 y 1 quedan contiguos en memoria.
+_MIN_DOS_AGUAS = np.ascontiguousarray(np.swapaxes(_MIN_DOS_AGUAS, -1, -2))
+_MIN_UN_AGUA = np.ascontiguousarray(np.swapaxes(_MIN_UN_AGUA, -1, -2))
+
+
+def _validar_angulo_dos_aguas(angulo):
+    """Verifica que el Reglamento cubra el ángulo de una cubierta aislada a
+    dos aguas.
+
+    :raises ErrorLineamientos: Si el ángulo está entre -5° y 5°.
+    """
+    if -5 < angulo < 5:
+        raise excepciones.ErrorLineamientos(
+            'El Reglamento no provee lineamientos para calcular los'
+            ' coeficientes de presión neta para cubiertas aisladas'
+            f' a dos aguas con ángulo igual a {angulo:.2f}°.'
+        )
 
 
-class CubiertaAisladaDosAguas:
-    """Esta clase utiliza para determinar los coeficientes de presión neta de
-    cubiertas aisladas a dos aguas.
+def _validar_angulo_un_agua(angulo):
+    """Verifica que el Reglamento cubra el ángulo de una cubierta aislada a
+    un agua.
+
+    :raises ErrorLineamientos: Si el ángulo está fuera del rango 0° a 30°.
+    """
+    if not 0 <= angulo <= 30:
+        raise excepciones.ErrorLineamientos(
+            'El Reglamento no provee lineamientos para calcular los'
+            ' coeficientes de presión neta para cubiertas aisladas'
+            f' a un agua con ángulo igual a {angulo}°.'
+        )
+
+
+def _indice_posicion_bloqueo(posicion_bloqueo):
+    """Retorna el índice de la posición de bloqueo en las tablas de mínimos.
+
+    :raises ValueError: Si la posición de bloqueo no es válida.
+    :rtype: int
+    """
+    try:
+        return _POSICIONES_BLOQUEO[posicion_bloqueo]
+    except KeyError:
+        raise ValueError(
+            f'Posición de bloqueo desconocida: {posicion_bloqueo}'
+        ) from None
+
+
+# Conjunto de tablas de Cpn de un tipo de cubierta. `minimos` tiene forma
+# (zonas, 2, ángulos) y `zonas` los nombres de las zonas locales.
+_TablasCpn = namedtuple('_TablasCpn', 'angulos maximos minimos zonas')
+
+# Las claves son el tipo de cubierta y el índice de la posición de bloqueo,
+# que no se usa en cubiertas a dos aguas.
+_TABLAS_CPN = {
+    ('dos aguas', 0): _TablasCpn(
+        _ANGULOS_DOS_AGUAS, _MAX_DOS_AGUAS, _MIN_DOS_AGUAS,
+        ('a', 'b', 'c', 'd')
+    ),
+    **{
+        ('un agua', posicion): _TablasCpn(
+            _ANGULOS_UN_AGUA, _MAX_UN_AGUA, _MIN_UN_AGUA[posicion],
+            ('a', 'b', 'c')
+        ) for posicion in _POSICIONES_BLOQUEO.values()
+    }
+}
+
+
+def _interpolar_cpn(angulo, relacion_bloqueo, tablas):
+    """Interpola los valores de Cpn de todas las zonas de una tabla.
+
+    Se busca una única vez el intervalo de ángulos que contiene a `angulo`.
+    Fuera del rango de la tabla se toman los valores extremos, igual que
+    :func:`numpy.interp`.
 
     :param float angulo: El ángulo de la cubierta.
-    :param float relacion_bloqueo: La relación entre la altura de bloqueo y la
-        altura de alero de cubierta.
+    :param float relacion_bloqueo: La relación de bloqueo, entre 0 y 1.
+    :param tablas: Las tablas de Cpn, una instancia de :class:`_TablasCpn`.
 
-    .. note:: Todos los parámetros numéricos deben ser positivos.
+    :returns: ``tuple`` con dos listas de ``float``, los máximos y mínimos de
+        cada zona.
+    :rtype: tuple
     """
-    def __init__(self, angulo, relacion_bloqueo):
-        if -5 < angulo < 5:
-            raise excepciones.ErrorLineamientos(
-                'El Reglamento no provee lineamientos para calcular los'
-                ' coeficientes de presión neta para cubiertas aisladas'
-                f' a dos aguas con ángulo igual a {angulo:.2f}°.'
+    angulos, maximos, minimos = tablas.angulos, tablas.maximos, tablas.minimos
+    ultimo = len(angulos) - 2
+    # Con side='right' un ángulo igual a un nodo de la tabla cae en el
+    # intervalo que empieza en ese nodo.
+    i = int(np.searchsorted(angulos, angulo, side='right')) - 1
+    i = min(max(i, 0), ultimo)
+    x0, x1 = angulos[i], angulos[i + 1]
+    w = min(max((angulo - x0) / (x1 - x0), 0.0), 1.0)
+    valores_maximos = maximos[:, i] + w * (maximos[:, i + 1] - maximos[:, i])
+    # Interpolación lineal entre relación de bloqueo 0 y 1, solo para las dos
+    # columnas del intervalo.
+    bloqueo_0 = minimos[:, 0, i:i + 2]
+    bloqueo_1 = minimos[:, 1, i:i + 2]
+    tabla_minimos = bloqueo_0 + relacion_bloqueo * (bloqueo_1 - bloqueo_0)
+    valores_minimos = tabla_minimos[:, 0] + w * (
+        tabla_minimos[:, 1] - tabla_minimos[:, 0]
+    )
+    return valores_maximos.tolist(), valores_minimos.tolist()
+
+
+def _interpolar_cpn_lote(angulos, relaciones_bloqueo, tablas):
+    """Versión vectorizada de :func:`_interpolar_cpn` para varios casos.
+
+    :param angulos: Array de forma (n,) con los ángulos de las cubiertas.
+    :param relaciones_bloqueo: Array de forma (n,) con las relaciones de
+        bloqueo.
+    :param tablas: Las tablas de Cpn, una instancia de :class:`_TablasCpn`.
+
+    :returns: ``tuple`` con dos arrays de forma (zonas, n), los máximos y
+        mínimos de cada zona.
+    :rtype: tuple
+    """
+    tabla_angulos, maximos = tablas.angulos, tablas.maximos
+    ultimo = len(tabla_angulos) - 2
+    i = np.clip(
+        np.searchsorted(tabla_angulos, angulos, side='right') - 1, 0, ultimo
+    )
+    x0, x1 = tabla_angulos[i], tabla_angulos[i + 1]
+    w = np.clip((angulos - x0) / (x1 - x0), 0.0, 1.0)
+    valores_maximos = maximos[:, i] + w * (maximos[:, i + 1] - maximos[:, i])
+    bloqueo_0 = tablas.minimos[:, 0]
+    bloqueo_1 = tablas.minimos[:, 1]
+    minimos_0 = bloqueo_0[:, i] + relaciones_bloqueo * (
+        bloqueo_1[:, i] - bloqueo_0[:, i]
+    )
+    minimos_1 = bloqueo_0[:, i + 1] + relaciones_bloqueo * (
+        bloqueo_1[:, i + 1] - bloqueo_0[:, i + 1]
+    )
+    valores_minimos = minimos_0 + w * (minimos_1 - minimos_0)
+    return valores_maximos, valores_minimos
+
+
+def _armar_valores(zonas, maximos, minimos):
+    """Arma el ``dict`` de Cpn a partir de los valores interpolados.
+
+    :param tuple zonas: Los nombres de las zonas locales.
+    :param list maximos: Los máximos, el global primero y luego cada zona.
+    :param list minimos: Los mínimos, en el mismo orden que `maximos`.
+
+    :rtype: dict
+    """
+    maximo_global, *maximos_locales = maximos
+    minimo_global, *minimos_locales = minimos
+    return {
+        'global': {'máx': maximo_global, 'mín': minimo_global},
+        'local': {
+            zona: {'máx': maximo, 'mín': minimo}
+            for zona, maximo, minimo in zip(
+                zonas, maximos_locales, minimos_locales
             )
+        }
+    }
+
+
+@lru_cache(maxsize=512)
+def _valores(clave_tablas, angulo, relacion_bloqueo):
+    """Calcula los factores Cpn para una cubierta aislada.
+
+    El resultado se comparte entre instancias con los mismos parámetros, por
+    lo que se retorna como un ``dict`` de solo lectura en todos sus niveles.
+
+    :param tuple clave_tablas: La clave de las tablas en :data:`_TABLAS_CPN`.
+    """
+    tablas = _TABLAS_CPN[clave_tablas]
+    maximos, minimos = _interpolar_cpn(angulo, relacion_bloqueo, tablas)
+    return solo_lectura(_armar_valores(tablas.zonas, maximos, minimos))
+
+
+class _CubiertaAisladaBase:
+    """Base de las cubiertas aisladas. Las subclases definen la clave de sus
+    tablas en `_clave_tablas` y la referencia al Reglamento.
+    """
+    referencia = None
+    _clave_tablas = None
+
+    def __init__(self, angulo, relacion_bloqueo):
         self.angulo = angulo
         self.relacion_bloqueo = relacion_bloqueo
 
-    @cached_property
-    def referencia(self):
-        return 'Tabla I.2'
-
     @cached_property
     def valores(self):
-        """Calcula los factores Cpn para una cubierta a dos aguas.
+        """Calcula los factores Cpn para la cubierta. El resultado es de solo
+        lectura y se comparte entre instancias con los mismos parámetros.
 
         :returns: Los valores de Cf para cada zona de la cubierta
-        :rtype: dict
+        :rtype: types.MappingProxyType
         """
-        angulos = (-20, -15, -10, -5, 5, 10, 15, 20, 25, 30)
-        maximos_valores_globales = (0.7, 0.5, 0.4, 0.3, 0.3, 0.4, 0.4, 0.6, 0.7, 0.9)
-        maximos_valores_zona_a = (0.8, 0.6, 0.6, 0.5, 0.6, 0.7, 0.9, 1.1, 1.2, 1.3)
-        maximos_valores_zona_b = (1.6, 1.5, 1.4, 1.5, 1.8, 1.8, 1.9, 1.9, 1.9, 1.9)
-        maximos_valores_zona_c = (0.6, 0.7, 0.8, 0.8, 1.3, 1.4, 1.4, 1.5, 1.6, 1.6)
-        maximos_valores_zona_d = (1.7, 1.4, 1.1, 0.8, 0.4, 0.4, 0.4, 0.4, 0.5, 0.7)
-        minimos_valores_globales = (
-            (-0.7, -1.5), (-0.6, -1.5), (-0.6, -1.4), (-0.5, -1.4), (-0.6, -1.2),
-            (-0.7, -1.2), (-0.8, -1.2), (-0.9, -1.2), (-1.0, -1.2), (-1.0, -1.2)
-        )
-        minimos_valores_zona_a = (
-            (-0.9, -1.5), (-0.8, -1.5), (-0.8, -1.4), (-0.5, -1.4), (-0.6, -1.2),
-            (-0.7, -1.2), (-0.9, -1.2), (-1.2, -1.2), (-1.4, -1.2), (-1.4, -1.2)
-        )
-        minimos_valores_zona_b = (
-            (-1.3, -2.4), (-1.3, -2.7), (-1.3, -2.5), (-1.3, -2.3), (-1.4, -2.0),
-            (-1.5, -1.8), (-1.7, -1.6), (-1.8, -1.5), (-1.9, -1.4), (-1.9, -1.3)
-        )
-        minimos_valores_zona_c = (
-            (-1.6, -2.4), (-1.6, -2.6), (-1.5, -2.5), (-1.6, -2.4), (-1.4, -1.8),
-            (-1.4, -1.6), (-1.4, -1.3), (-1.4, -1.2), (-1.4, -1.1), (-1.4, -1.1)
-        )
-        minimos_valores_zona_d = (
-            (-0.6, -1.2), (-0.6, -1.2), (-0.6, -1.2), (-0.6, -1.2), (-1.1, -1.5),
-            (-1.4, -1.6), (-1.8, -1.7), (-2.0, -1.7), (-2.0, -1.6), (-2.0, -1.6)
-        )
-        valor_maximo_global = np.interp(self.angulo, angulos, maximos_valores_globales)
-        valor_maximo_zona_a = np.interp(self.angulo, angulos, maximos_valores_zona_a)
-        valor_maximo_zona_b = np.interp(self.angulo, angulos, maximos_valores_zona_b)
-        valor_maximo_zona_c = np.interp(self.angulo, angulos, maximos_valores_zona_c)
-        valor_maximo_zona_d = np.interp(self.angulo, angulos, maximos_valores_zona_d)
+        return _valores(self._clave_tablas, self.angulo, self.relacion_bloqueo)
 
-        bloqueos = [0, 1]
+    def __call__(self):
+        return self.valores
 
-        minimos_valores_globales_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_globales
-        )
-        minimos_valores_caso_a_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_a
-        )
-        minimos_valores_caso_b_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_b
-        )
-        minimos_valores_caso_c_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_c
-        )
-        minimos_valores_caso_d_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_d
-        )
 
-        valor_minimo_global = np.interp(
-            self.angulo, angulos, minimos_valores_globales_relacion
-        )
-        valor_minimo_zona_a = np.interp(
-            self.angulo, angulos, minimos_valores_caso_a_relacion
-        )
-        valor_minimo_zona_b = np.interp(
-            self.angulo, angulos, minimos_valores_caso_b_relacion
-        )
-        valor_minimo_zona_c = np.interp(
-            self.angulo, angulos, minimos_valores_caso_c_relacion
-        )
-        valor_minimo_zona_d = np.interp(
-            self.angulo, angulos, minimos_valores_caso_d_relacion
-        )
+class CubiertaAisladaDosAguas(_CubiertaAisladaBase):
+    """Esta clase utiliza para determinar los coeficientes de presión neta de
+    cubiertas aisladas a dos aguas.
 
-        valores = {
-            'global': {
-                'máx': valor_maximo_global,
-                'mín': valor_minimo_global
-            },
-            'local': {
-                'a': {'máx': valor_maximo_zona_a,
-                      'mín': valor_minimo_zona_a},
-                'b': {'máx': valor_maximo_zona_b,
-                      'mín': valor_minimo_zona_b},
-                'c': {'máx': valor_maximo_zona_c,
-                      'mín': valor_minimo_zona_c},
-                'd': {'máx': valor_maximo_zona_d,
-                      'mín': valor_minimo_zona_d}
-            }
-        }
-        return valores
+    :param float angulo: El ángulo de la cubierta.
+    :param float relacion_bloqueo: La relación entre la altura de bloqueo y la
+        altura de alero de cubierta.
+
+    .. note:: Todos los parámetros numéricos deben ser positivos.
+    """
+    referencia = 'Tabla I.2'
+    _clave_tablas = ('dos aguas', 0)
+
+    def __init__(self, angulo, relacion_bloqueo):
+        _validar_angulo_dos_aguas(angulo)
+        super().__init__(angulo, relacion_bloqueo)
 
     @classmethod
     def desde_cubierta(cls, cubierta):
@@ -148,11 +302,8 @@ class CubiertaAisladaDosAguas:
         """
         return cls(cubierta.angulo, cubierta.relacion_bloqueo)
 
-    def __call__(self):
-        return self.valores
-
 
-class CubiertaAisladaUnAgua:
+class CubiertaAisladaUnAgua(_CubiertaAisladaBase):
     """Esta clase utiliza para determinar los coeficientes de presión neta de
     cubiertas aisladas a un agua.
 
@@ -162,114 +313,15 @@ class CubiertaAisladaUnAgua:
 
     .. note:: Todos los parámetros numéricos deben ser positivos.
     """
+    referencia = 'Tabla I.1'
+
     def __init__(self, angulo, relacion_bloqueo, posicion_bloqueo):
-        if not 0 <= angulo <= 30:
-            raise excepciones.ErrorLineamientos(
-                'El Reglamento no provee lineamientos para calcular los'
-                ' coeficientes de presión neta para cubiertas aisladas'
-                f' a un agua con ángulo igual a {angulo}°.'
-            )
-        self.angulo = angulo
-        self.relacion_bloqueo = relacion_bloqueo
+        _validar_angulo_un_agua(angulo)
+        super().__init__(angulo, relacion_bloqueo)
         self.posicion_bloqueo = posicion_bloqueo
-
-    @cached_property
-    def referencia(self):
-        return 'Tabla I.1'
-
-    @cached_property
-    def valores(self):
-        """Calcula los factores Cpn para una cubierta a un agua.
-
-        :returns: Los valores de Cf para cada zona de la cubierta
-        :rtype: dict
-        """
-        angulos = (0, 5, 10, 15, 20, 25, 30)
-        maximos_valores_globales = (0.2, 0.4, 0.5, 0.7, 0.8, 1, 1.2)
-        maximos_valores_zona_a = (0.5, 0.8, 1.2, 1.4, 1.7, 2, 2.2)
-        maximos_valores_zona_b = (1.8, 2.1, 2.4, 2.7, 2.9, 3.1, 3.2)
-        maximos_valores_zona_c = (1.1, 1.3, 1.6, 1.8, 2.1, 2.3, 2.4)
-        minimos_valores_globales = {
-            'alero mas bajo': ((-0.5, -1.2), (-0.7, -1.4), (-0.9, -1.4), (-1.1, -1.5),
-                               (-1.3, -1.5), (-1.6, -1.4), (-1.8, -1.4)),
-            'alero mas alto': ((-0.5, -1.2), (-0.7, -1.2), (-0.9, -1.1), (-1.1, -1),
-                               (-1.3, -0.9), (-1.6, -0.8), (-1.8, -0.8))
-        }
-        minimos_valores_zona_a = {
-            'alero mas bajo': ((-0.6, -1.3), (-1.1, -1.4), (-1.5, -1.4), (-1.8, -1.5),
-                               (-2.2, -1.5), (-2.6, -1.4), (-3.0, -1.4)),
-            'alero mas alto': ((-0.6, -1.3), (-1.1, -1.2), (-1.5, -1.1), (-1.8, -1),
-                               (-2.2, -0.9), (-2.6, -0.8), (-3.0, -0.8))
-        }
-        minimos_valores_zona_b = (
-            (-1.3, -1.8), (-1.7, -2.6), (-2.0, -2.6), (-2.4, -2.9), (-2.8, -2.9),
-            (-3.2, -2.5), (-3.8, -2.0)
-        )
-        minimos_valores_zona_c = {
-            'alero mas bajo': ((-1.4, -2.2), (-1.8, -2.6), (-2.1, -2.7), (-2.5, -2.8),
-                               (-2.9, -2.7), (-3.2, -2.5), (-3.6, -2.3)),
-            'alero mas alto': ((-1.4, -2.2), (-1.8, -2.1), (-2.1, -1.8), (-2.5, -1.6),
-                               (-2.9, -1.5), (-3.2, -1.4), (-3.6, -1.2)),
-        }
-        valor_maximo_global = np.interp(
-            self.angulo, angulos, maximos_valores_globales
-        )
-        valor_maximo_zona_a = np.interp(
-            self.angulo, angulos, maximos_valores_zona_a
-        )
-        valor_maximo_zona_b = np.interp(
-            self.angulo, angulos, maximos_valores_zona_b
-        )
-        valor_maximo_zona_c = np.interp(
-            self.angulo, angulos, maximos_valores_zona_c
-        )
-
-        bloqueos = [0, 1]
-
-        minimos_valores_globales_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_globales[self.posicion_bloqueo]
-        )
-        minimos_valores_caso_a_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_a[self.posicion_bloqueo]
-        )
-        minimos_valores_caso_b_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_b
-        )
-        minimos_valores_caso_c_relacion = tuple(
-            np.interp(self.relacion_bloqueo, bloqueos, valores)
-            for valores in minimos_valores_zona_c[self.posicion_bloqueo]
-        )
-
-        valor_minimo_global = np.interp(
-            self.angulo, angulos, minimos_valores_globales_relacion
+        self._clave_tablas = (
+            'un agua', _indice_posicion_bloqueo(posicion_bloqueo)
         )
-        valor_minimo_zona_a = np.interp(
-            self.angulo, angulos, minimos_valores_caso_a_relacion
-        )
-        valor_minimo_zona_b = np.interp(
-            self.angulo, angulos, minimos_valores_caso_b_relacion
-        )
-        valor_minimo_zona_c = np.interp(
-            self.angulo, angulos, minimos_valores_caso_c_relacion
-        )
-        valores = {
-            'global': {
-                'máx': valor_maximo_global,
-                'mín': valor_minimo_global
-            },
-            'local': {
-                'a': {'máx': valor_maximo_zona_a,
-                      'mín': valor_minimo_zona_a},
-                'b': {'máx': valor_maximo_zona_b,
-                      'mín': valor_minimo_zona_b},
-                'c': {'máx': valor_maximo_zona_c,
-                      'mín': valor_minimo_zona_c}
-            }
-        }
-        return valores
 
     @classmethod
     def desde_cubierta(cls, cubierta):
@@ -280,17 +332,106 @@ class CubiertaAisladaUnAgua:
         return cls(cubierta.angulo, cubierta.relacion_bloqueo,
                    cubierta.posicion_bloqueo)
 
-    def __call__(self):
-        return self.valores
 
+def cubierta_aislada_lote(tipo_cubierta, angulos, relaciones_bloqueo,
+                          posicion_bloqueo='alero mas bajo'):
+    """Calcula los factores Cpn de varias cubiertas aisladas del mismo tipo en
+    una sola pasada, pensado para barridos de parámetros.
 
-def cubierta_aislada(cubierta):
-    if cubierta.tipo == 'dos aguas':
-        return CubiertaAisladaDosAguas.desde_cubierta(cubierta)
-    elif cubierta.tipo == 'un agua':
-        return CubiertaAisladaUnAgua.desde_cubierta(cubierta)
+    :param str tipo_cubierta: El tipo de cubierta, `dos aguas` o `un agua`.
+    :param angulos: Los ángulos de las cubiertas.
+    :param relaciones_bloqueo: Las relaciones de bloqueo de cada cubierta.
+    :param str posicion_bloqueo: La posición de bloqueo, común a todas las
+        cubiertas. Solo se usa para cubiertas a un agua.
+
+    :returns: ``tuple`` con dos arrays de forma (zonas, n), los máximos y
+        mínimos. La primera fila es el valor global y las siguientes las zonas
+        locales en orden alfabético.
+    :rtype: tuple
+    """
+    angulos = np.asarray(angulos, dtype=np.float64)
+    relaciones_bloqueo = np.asarray(relaciones_bloqueo, dtype=np.float64)
+    if tipo_cubierta == 'dos aguas':
+        if ((-5 < angulos) & (angulos < 5)).any():
+            raise excepciones.ErrorLineamientos(
+                'El Reglamento no provee lineamientos para calcular los'
+                ' coeficientes de presión neta para cubiertas aisladas'
+                ' a dos aguas con ángulo entre -5° y 5°.'
+            )
+        clave_tablas = ('dos aguas', 0)
+    elif tipo_cubierta == 'un agua':
+        if ((angulos < 0) | (angulos > 30)).any():
+            raise excepciones.ErrorLineamientos(
+                'El Reglamento no provee lineamientos para calcular los'
+                ' coeficientes de presión neta para cubiertas aisladas'
+                ' a un agua con ángulo fuera del rango 0° a 30°.'
+            )
+        clave_tablas = ('un agua', _indice_posicion_bloqueo(posicion_bloqueo))
     else:
         raise excepciones.ErrorLineamientos(
             'El Reglamento no provee lineamientos para cubiertas aisladas de'
-            f' tipo: {cubierta.tipo}'
+            f' tipo: {tipo_cubierta}'
         )
+    return _interpolar_cpn_lote(
+        angulos, relaciones_bloqueo, _TABLAS_CPN[clave_tablas]
+    )
+
+
+def cubierta_dos_aguas_lote(angulos, relaciones_bloqueo):
+    """Calcula los factores Cpn de varias cubiertas aisladas a dos aguas en
+    una sola pasada.
+
+    :param angulos: Los ángulos de las cubiertas.
+    :param relaciones_bloqueo: Las relaciones de bloqueo de cada cubierta.
+
+    :returns: Un ``dict`` con la misma estructura que
+        :attr:`CubiertaAisladaDosAguas.valores`, donde cada valor es un array
+        con un elemento por cubierta.
+    :rtype: dict
+    """
+    maximos, minimos = cubierta_aislada_lote(
+        'dos aguas', angulos, relaciones_bloqueo
+    )
+    return _armar_valores(
+        _TABLAS_CPN[CubiertaAisladaDosAguas._clave_tablas].zonas,
+        maximos, minimos
+    )
+
+
+def cubierta_un_agua_lote(angulos, relaciones_bloqueo, posicion_bloqueo):
+    """Calcula los factores Cpn de varias cubiertas aisladas a un agua en una
+    sola pasada.
+
+    :param angulos: Los ángulos de las cubiertas.
+    :param relaciones_bloqueo: Las relaciones de bloqueo de cada cubierta.
+    :param str posicion_bloqueo: La posición de bloqueo, común a todas las
+        cubiertas.
+
+    :returns: Un ``dict`` con la misma estructura que
+        :attr:`CubiertaAisladaUnAgua.valores`, donde cada valor es un array
+        con un elemento por cubierta.
+    :rtype: dict
+    """
+    maximos, minimos = cubierta_aislada_lote(
+        'un agua', angulos, relaciones_bloqueo, posicion_bloqueo
+    )
+    return _armar_valores(
+        _TABLAS_CPN[('un agua', 0)].zonas, maximos, minimos
+    )
+
+
+_CUBIERTAS_AISLADAS = {
+    'dos aguas': CubiertaAisladaDosAguas.desde_cubierta,
+    'un agua': CubiertaAisladaUnAgua.desde_cubierta
+}
+
+
+def cubierta_aislada(cubierta):
+    try:
+        desde_cubierta = _CUBIERTAS_AISLADAS[cubierta.tipo]
+    except KeyError:
+        raise excepciones.ErrorLineamientos(
+            'El Reglamento no provee lineamientos para cubiertas aisladas de'
+            f' tipo: {cubierta.tipo}'
+        ) from None
+    return desde_cubierta(cubierta)
@@ -15,8 +15,39 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-from cached_property import cached_property
-import numpy as np
+from functools import cached_property, lru_cache
+from .utilidades import interpolar
+
+
+# Relaciones de lados y coeficientes de fuerza para carteles. Las relaciones
+# se indexan según el cartel esté a nivel (0) o sobre nivel de terreno (1).
+_RELACIONES = (
+    (3, 5, 8, 10, 20, 30, 40),
+    (6, 10, 16, 20, 40, 60, 80)
+)
+_CFS = (1.2, 1.3, 1.4, 1.5, 1.75, 1.85, 2.0)
+
+
+def _sobre_nivel_terreno(altura_inferior, altura_neta, es_parapeto):
+    """Determina si un cartel esta sobre o a nivel del terreno.
+
+    :rtype: bool
+    """
+    return not es_parapeto and bool(altura_inferior >= 0.25 * altura_neta)
+
+
+@lru_cache(maxsize=256)
+def _cf(relacion, sobre_nivel_terreno):
+    """Calcula el coeficiente de fuerza para un cartel. El resultado se
+    comparte entre carteles con la misma relación de lados.
+
+    :param float relacion: La relación de lados del cartel.
+    :param bool sobre_nivel_terreno: Indica si el cartel esta sobre nivel de
+        terreno.
+
+    :rtype: float
+    """
+    return float(interpolar(relacion, _RELACIONES[sobre_nivel_terreno], _CFS))
 
 
 class Cartel:
@@ -35,6 +66,13 @@ class Cartel:
         self.altura_neta = altura_neta
         self.ancho = ancho
         self.es_parapeto = es_parapeto
+        self._sobre_nivel_terreno = _sobre_nivel_terreno(
+            altura_inferior, altura_neta, es_parapeto
+        )
+        if self._sobre_nivel_terreno:
+            self._relacion = max(altura_neta, ancho) / min(altura_neta, ancho)
+        else:
+            self._relacion = altura_neta / ancho
 
     def sobre_nivel_terreno(self):
         """Determina si el cartel esta sobre o a nivel del terreno.
@@ -42,11 +80,7 @@ class Cartel:
         :returns: `True` si esta sobre nivel de terreno.
         :rtype: bool
         """
-        if self.es_parapeto:
-            return False
-        if self.altura_inferior < 0.25 * self.altura_neta:
-            return False
-        return True
+        return self._sobre_nivel_terreno
 
     @cached_property
     def cf(self):
@@ -54,29 +88,7 @@ class Cartel:
 
         :rtype: float
         """
-        if self.sobre_nivel_terreno():
-            return self._sobre_nivel_terreno()
-        return self._a_nivel_terreno()
-
-    def _sobre_nivel_terreno(self):
-        """Retorna el factor cf para un cartel sobre de terreno.
-
-        :rtype: float
-        """
-        m_n = (6, 10, 16, 20, 40, 60, 80)
-        cfs = (1.2, 1.3, 1.4, 1.5, 1.75, 1.85, 2)
-        m = max(self.altura_neta, self.ancho)
-        n = min(self.altura_neta, self.ancho)
-        return np.interp(m / n, m_n, cfs)
-
-    def _a_nivel_terreno(self):
-        """Retorna el factor cf para un cartel a nivel de terreno.
-
-        :rtype: float
-        """
-        m_n = (3, 5, 8, 10, 20, 30, 40)
-        cfs = (1.2, 1.3, 1.4, 1.5, 1.75, 1.85, 2)
-        return np.interp(self.altura_neta / self.ancho, m_n, cfs)
+        return _cf(self._relacion, self._sobre_nivel_terreno)
 
     @classmethod
     def desde_cartel(cls, cartel, es_parapeto=False):
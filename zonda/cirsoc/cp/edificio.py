@@ -15,68 +15,178 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-from collections import defaultdict
+from functools import cached_property, lru_cache
 from math import log10
 import numpy as np
-from cached_property import cached_property
 from zonda.cirsoc import excepciones
+from .utilidades import interpolar, solo_lectura
+
+
+# Figura 3 (cont.) - Cubierta a barlovento con el viento normal a la cumbrera.
+# Cada fila corresponde a un ángulo y cada columna a una relación h/L. El
+# último valor de la primera fila del caso A se afecta por la reducción por
+# área.
+_ANGULOS_BARLOVENTO = (10, 15, 20, 25, 30, 35, 45, 60, 80)
+_RELACIONES_BARLOVENTO = np.array((0.25, 0.5, 1), dtype=np.float64)
+_CP_BARLOVENTO_CASO_A = np.array((
+    (-0.7, -0.9, -1.3), (-0.5, -0.7, -1),
+    (-0.3, -0.4, -0.7), (-0.2, -0.3, -0.5),
+    (-0.2, -0.2, -0.3), (0, -0.2, -0.2),
+    (0, 0, 0), (0, 0, 0), (0, 0, 0)
+), dtype=np.float64)
+_CP_BARLOVENTO_CASO_B = np.array((
+    (0, 0, 0), (0, 0, 0), (0.2, 0, 0),
+    (0.3, 0.2, 0), (0.3, 0.2, 0.2), (0.4, 0.3, 0.2),
+    (0.4, 0.4, 0.3), (0.6, 0.6, 0.6), (0.8, 0.8, 0.8)
+), dtype=np.float64)
+
+# Figura 3 (cont.) - Cubierta a sotavento. Cada fila corresponde a un ángulo
+# y cada columna a una relación h/L.
+_ANGULOS_SOTAVENTO = (10, 15, 20)
+_RELACIONES_SOTAVENTO = np.array((0.25, 0.5, 1), dtype=np.float64)
+_CP_SOTAVENTO = np.array((
+    (-0.3, -0.5, -0.7), (-0.5, -0.5, -0.6), (-0.6, -0.6, -0.6)
+), dtype=np.float64)
+
+# Figura 3 (cont.) - Cubierta con el viento paralelo a la cumbrera o con
+# ángulo < 10°. Cada fila es una zona y cada columna una relación h/L. El
+# último valor de la primera zona se afecta por la reducción por área.
+_RELACIONES_ANGULO_MENOR_DIEZ = np.array((0.5, 1), dtype=np.float64)
+_CP_ANGULO_MENOR_DIEZ = np.array((
+    (-0.9, -1.3), (-0.9, -0.7), (-0.5, -0.7), (-0.3, -0.7)
+), dtype=np.float64)
+
+for _tabla in (_RELACIONES_BARLOVENTO, _CP_BARLOVENTO_CASO_A,
+               _CP_BARLOVENTO_CASO_B, _RELACIONES_SOTAVENTO, _CP_SOTAVENTO,
+               _RELACIONES_ANGULO_MENOR_DIEZ, _CP_ANGULO_MENOR_DIEZ):
+    _tabla.setflags(write=False)
+del _tabla
+
+# Reducción de Cp de cubierta según el área, Figura 3 (cont.).
+_AREAS_REDUCCION = (10, 25, 100)
+_FACTORES_REDUCCION = (1.0, 0.9, 0.8)
+
+# Cp de pared a sotavento según la relación L/B, Figura 3 (cont.).
+_RELACIONES_PARED_SOTAVENTO = (0, 1, 2, 4)
+_CP_PARED_SOTAVENTO = (-0.5, -0.5, -0.3, -0.2)
+
+
+# log10 del cociente entre las áreas límite de las figuras de componentes y
+# revestimientos, usado como denominador en la interpolación de cp.
+_LOG10_RANGOS_AREAS = {
+    areas: log10(areas[1] / areas[0])
+    for areas in ((1, 10), (1, 50), (2, 50), (10, 50))
+}
+
+
+def _interpolar_filas(x, xs, tabla):
+    """Interpola todas las filas de una tabla en un mismo valor de abscisa.
+
+    El intervalo que contiene a `x` se busca una sola vez y la interpolación
+    se hace sobre las dos columnas que lo limitan.
+
+    :param float x: El valor a interpolar.
+    :param xs: Array con los valores de abscisa, en orden creciente.
+    :param tabla: Array de forma (filas, len(xs)).
+
+    :returns: Una lista con el valor interpolado de cada fila.
+    :rtype: list
+    """
+    i = int(np.searchsorted(xs, x, side='right')) - 1
+    i = min(max(i, 0), len(xs) - 2)
+    w = min(max((x - xs[i]) / (xs[i + 1] - xs[i]), 0.0), 1.0)
+    return (tabla[:, i] + w * (tabla[:, i + 1] - tabla[:, i])).tolist()
 
 
-def dedupe(items):
-    """Remove duplicate for a sequence while maintaining order.
+def _rangos_cp_cr(cps, areas):
+    """Prepara los rangos de interpolación de una zona para
+    :func:`_cp_cr_desde_rangos`, con la pendiente y el log10 del área menor ya
+    calculados.
 
-    This only works if the items in the sequence are hashable.
+    :param tuple cps: Los cp de la zona, un par o un ``tuple`` de pares.
+    :param tuple areas: Las áreas de la zona, con la misma forma que `cps`.
 
-    Source:
-        Python Cookbook, Third Edition.
-        by David Beazley and Brian K. Jones.
-        Copyright © 2013 David Beazley and Brian Jones.
+    :returns: ``tuple`` con un ``tuple`` (primer_cp, ultimo_cp, primer_area,
+        ultima_area, g, log10_primer_area) para cada rango.
+    :rtype: tuple
     """
-    seen = set()
-    for item in items:
-        if item not in seen:
-            yield item
-            seen.add(item)
-
-
-def filtrar_cp_areas(cps, areas, area_componente):
-    cp_areas = tuple(zip(cps, areas))
-    numero_de_zonas = len(cp_areas)
-    for i, (cp, area) in enumerate(cp_areas):
-        if isinstance(cp, tuple) and isinstance(area, tuple):
-            primer_area, ultima_area = area
-            if area_componente > ultima_area:
-                if i == numero_de_zonas - 1:
-                    return cp, area
-                continue
-            return cp, area
-        return cps, areas
-
-
-def calcular_cp_cr(cps, areas, area_componente):
-    """Calcula el valor de cp para un componente en base a su area tributaria.
+    if not (isinstance(cps[0], tuple) and isinstance(areas[0], tuple)):
+        cps, areas = (cps,), (areas,)
+    rangos = []
+    for (primer_cp, ultimo_cp), (primer_area, ultima_area) in zip(cps, areas):
+        rango = _LOG10_RANGOS_AREAS.get((primer_area, ultima_area))
+        if rango is None:
+            rango = log10(ultima_area / primer_area)
+        rangos.append((
+            primer_cp, ultimo_cp, primer_area, ultima_area,
+            (ultimo_cp - primer_cp) / rango, log10(primer_area)
+        ))
+    return tuple(rangos)
+
+
+def _cp_cr_desde_rangos(rangos, area_componente):
+    """Calcula el valor de cp para un componente en base a su area tributaria,
+    interpolando linealmente en el log10 del área.
+
+    Se usa el primer rango cuya área mayor no es menor al área del componente,
+    o el último rango si el área los supera a todos.
 
     Referencia: Libro "DESIGN OF BUILDINGS FOR WIND - Second Edition" -
         Emil Simiu Pag. 96.
 
-    :param tuple cps: ``tuple`` con dos valores de cp entre los que
-        interpolar.
-    :param tuple areas: ``tuple`` con dos valores de área entre los que
-        interpolar.
-    :param float area_componente: El valor de área a utilizar para encontrar el valor de
-        cp por interpolación.
+    :param tuple rangos: Los rangos preparados por :func:`_rangos_cp_cr`.
+    :param float area_componente: El valor de área a utilizar para encontrar
+        el valor de cp por interpolación.
 
     :returns: El valor de cp.
     :rtype: float
     """
-    primer_cp, ultimo_cp = cps
-    primer_area, ultima_area = areas
+    area_componente = float(area_componente)
+    for (primer_cp, ultimo_cp, primer_area, ultima_area, g,
+         log10_primer_area) in rangos:
+        if area_componente <= ultima_area:
+            break
     if area_componente <= primer_area:
         return primer_cp
     if area_componente >= ultima_area:
         return ultimo_cp
-    g = (ultimo_cp - primer_cp) / log10(ultima_area / primer_area)
-    return primer_cp + g * log10(area_componente / primer_area)
+    return primer_cp + g * (log10(area_componente) - log10_primer_area)
+
+
+def calcular_cp_cr_lote(primeros_cps, ultimos_cps, areas, areas_componentes,
+                        factor=1):
+    """Versión vectorizada de :func:`_cp_cr_desde_rangos` para varias zonas y
+    componentes que comparten un único rango de áreas.
+
+    :param primeros_cps: Los valores de cp para la menor área de cada zona.
+    :param ultimos_cps: Los valores de cp para la mayor área de cada zona.
+    :param tuple areas: ``tuple`` con dos valores de área entre los que
+        interpolar.
+    :param areas_componentes: Las áreas de cada componente.
+    :param float factor: (opcional) Factor por el que se multiplican los
+        resultados. Default=1.
+
+    :returns: Array de forma (componentes, zonas) con los valores de cp.
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    primeros_cps = np.asarray(primeros_cps, dtype=float)
+    ultimos_cps = np.asarray(ultimos_cps, dtype=float)
+    areas_componentes = np.asarray(areas_componentes, dtype=float)
+    primer_area, ultima_area = areas
+    rango = _LOG10_RANGOS_AREAS.get((primer_area, ultima_area))
+    if rango is None:
+        rango = log10(ultima_area / primer_area)
+    g = (ultimos_cps - primeros_cps) / rango
+    # log10 de cada área una sola vez, compartido por todas las zonas.
+    log_areas = np.log10(
+        np.clip(areas_componentes, primer_area, ultima_area) / primer_area
+    )
+    valores = np.multiply.outer(log_areas, g)
+    valores += primeros_cps
+    valores[areas_componentes >= ultima_area] = ultimos_cps
+    if factor != 1:
+        valores *= factor
+    return valores
 
 
 def distancia_a(ancho, longitud, altura_media):
@@ -95,6 +205,81 @@ def distancia_a(ancho, longitud, altura_media):
     return max(valor_propuesto, limite_minimo)
 
 
+@lru_cache(maxsize=256)
+def _cp_barlovento_por_angulo(relacion, reduccion):
+    """Interpola las tablas de cubierta a barlovento en la relación h/L.
+
+    El resultado solo depende del ángulo de cubierta, por lo que se comparte
+    entre cubiertas con la misma relación y reducción por área.
+
+    :returns: ``tuple`` con los cp de los casos A y B para cada ángulo de
+        :data:`_ANGULOS_BARLOVENTO`.
+    :rtype: tuple
+    """
+    tabla_caso_a = _CP_BARLOVENTO_CASO_A.copy()
+    tabla_caso_a[0, -1] *= reduccion
+    return (
+        tuple(_interpolar_filas(relacion, _RELACIONES_BARLOVENTO, tabla_caso_a)),
+        tuple(_interpolar_filas(
+            relacion, _RELACIONES_BARLOVENTO, _CP_BARLOVENTO_CASO_B
+        ))
+    )
+
+
+@lru_cache(maxsize=256)
+def _cp_sotavento_por_angulo(relacion):
+    """Interpola la tabla de cubierta a sotavento en la relación h/L.
+
+    :returns: ``tuple`` con los cp para cada ángulo de
+        :data:`_ANGULOS_SOTAVENTO`.
+    :rtype: tuple
+    """
+    return tuple(
+        _interpolar_filas(relacion, _RELACIONES_SOTAVENTO, _CP_SOTAVENTO)
+    )
+
+
+@lru_cache(maxsize=512)
+def _valores_paredes_sprfv(ancho, longitud):
+    return solo_lectura(
+        ParedesSprfvMetodoDireccional(ancho, longitud)._calcular_valores()
+    )
+
+
+@lru_cache(maxsize=512)
+def _valores_paredes_componentes(ancho, longitud, altura_media,
+                                 angulo_cubierta, componentes):
+    paredes = ParedesComponentes(
+        ancho, longitud, altura_media, angulo_cubierta, dict(componentes)
+    )
+    return solo_lectura(paredes._calcular_valores())
+
+
+@lru_cache(maxsize=512)
+def _valores_cubierta_sprfv(ancho, longitud, altura_media, angulo):
+    cubierta = CubiertaMetodoDireccional(ancho, longitud, altura_media, angulo)
+    return solo_lectura(cubierta._calcular_valores())
+
+
+@lru_cache(maxsize=512)
+def _valores_alero_sprfv(ancho, longitud, altura_media, angulo):
+    valores = dict(
+        _valores_cubierta_sprfv(ancho, longitud, altura_media, angulo)
+    )
+    normal = valores['normal']
+    if angulo < 10:
+        cps = tuple(normal.values())
+        cp_barlovento = cps[0] - 0.8
+        cp_sotavento = cps[-1]
+    else:
+        cp_barlovento = {
+            key: valor - 0.8 for key, valor in normal['barlovento'].items()
+        }
+        cp_sotavento = normal['sotavento']
+    valores['normal'] = {'barlovento': cp_barlovento, 'sotavento': cp_sotavento}
+    return solo_lectura(valores)
+
+
 class ParedesSprfvMetodoDireccional:
     """Esta clase utiliza para determinar los coeficientes de presión de paredes
     de edificio para SPRFV usando el método direccional.
@@ -111,10 +296,15 @@ class ParedesSprfvMetodoDireccional:
     @cached_property
     def valores(self):
         """Calcula los valores de coeficiente de presión para paredes para SPRFV.
+        El resultado es de solo lectura y se comparte entre instancias con las
+        mismas dimensiones.
 
         :returns: ``dict`` con los valores de coeficiente de presión para paredes.
         :rtype: dict
         """
+        return _valores_paredes_sprfv(self.ancho, self.longitud)
+
+    def _calcular_valores(self):
         pared_sotavento_cp_paralelo = self._cp_pared_sotavento(
             self.longitud, self.ancho
         )
@@ -150,10 +340,8 @@ class ParedesSprfvMetodoDireccional:
 
         :rtype: float
         """
-        relaciones_paralelo_normal = (0, 1, 2, 4)
-        valores_cp = (-0.5, -0.5, -0.3, -0.2)
-        return np.interp(dimension_paralela / dimension_normal,
-                         relaciones_paralelo_normal, valores_cp)
+        return interpolar(dimension_paralela / dimension_normal,
+                          _RELACIONES_PARED_SOTAVENTO, _CP_PARED_SOTAVENTO)
 
     def __call__(self):
         return self.valores
@@ -163,6 +351,18 @@ class ParedesMetodoEnvolvente:
     pass
 
 
+# Figuras 5A (h <= 20 m) y 8 (h > 20 m) - Componentes y revestimientos de
+# paredes. Se indexa con 0 si h <= 20 y 1 si h > 20, y cada caso tiene las
+# zonas, los cp para el área menor y mayor de cada zona, el rango de áreas y
+# la figura.
+_CASOS_COMPONENTES_PARED = (
+    (('4', '5', 'Todas'), (-1.1, -1.4, 1), (-0.8, -0.8, 0.7), (1, 50),
+     'Figura 5A'),
+    (('4', '5', 'Todas'), (-0.9, -1.8, 0.9), (-0.7, -1, 0.6), (2, 50),
+     'Figura 8')
+)
+
+
 class ParedesComponentes:
     """Esta clase utiliza para determinar los coeficientes de presión de paredes
     de edificio para Componentes y Revestimientos.
@@ -182,6 +382,7 @@ class ParedesComponentes:
         self.altura_media = altura_media
         self.angulo_cubierta = angulo_cubierta
         self.componentes = componentes
+        self._indice_caso = 1 if altura_media > 20 else 0
 
     @cached_property
     def valores(self):
@@ -196,25 +397,25 @@ class ParedesComponentes:
             raise ValueError(
                 'No hay componentes para determinar los coeficientes de presión'
             )
-        valores_zonas_cp = {
-            'A': {'4': (-1.1, -0.8), '5': (-1.4, -0.8), 'Todas': (1, 0.7)},
-            'B': {'4': (-0.9, -0.7), '5': (-1.8, -1), 'Todas': (0.9, 0.6)}
-        }
-        caso = self._caso()
+        return _valores_paredes_componentes(
+            self.ancho, self.longitud, self.altura_media, self.angulo_cubierta,
+            tuple(self.componentes.items())
+        )
+
+    def _calcular_valores(self):
+        caso = _CASOS_COMPONENTES_PARED[self._indice_caso]
+        zonas, primeros_cps, ultimos_cps, area, _ = caso
         factor_reduccion = 1
-        if caso == 'B':
-            area = (2, 50)
-        else:
-            area = (1, 50)
-            if self.angulo_cubierta <= 10:
-                factor_reduccion = 0.9
-        caso_cp = valores_zonas_cp[caso]
-        valor_cp = defaultdict(dict)
-        for nombre, area_componente in self.componentes.items():
-            for zona, cp in caso_cp.items():
-                valor_cp[nombre][zona] = calcular_cp_cr(
-                    cp, area, area_componente) * factor_reduccion
-        return valor_cp
+        if not self._indice_caso and self.angulo_cubierta <= 10:
+            factor_reduccion = 0.9
+        valores_cp = calcular_cp_cr_lote(
+            primeros_cps, ultimos_cps, area, tuple(self.componentes.values()),
+            factor_reduccion
+        )
+        return {
+            nombre: dict(zip(zonas, fila))
+            for nombre, fila in zip(self.componentes, valores_cp.tolist())
+        }
 
     @cached_property
     def distancia_a(self):
@@ -222,8 +423,7 @@ class ParedesComponentes:
 
     @cached_property
     def referencia(self):
-        ref = {'A': 'Figura 5A', 'B': 'Figura 8'}
-        return ref[self._caso()]
+        return _CASOS_COMPONENTES_PARED[self._indice_caso][-1]
 
     def _caso(self):
         """Determina el caso según el reglamento a usar para calcular los
@@ -256,6 +456,12 @@ class CubiertaMetodoDireccional:
         self.longitud = longitud
         self.altura_media = altura_media
         self.angulo = angulo
+        self._normal_como_paralelo = angulo < 10
+        self._zonas_paralelo = self._zonas_cubierta(altura_media, longitud)
+        if self._normal_como_paralelo:
+            self._zonas_normal = self._zonas_cubierta(altura_media, ancho)
+        else:
+            self._zonas_normal = None
 
     def normal_como_paralelo(self):
         """Determina si los coeficientes de presion sobre cubierta con el viento
@@ -264,9 +470,7 @@ class CubiertaMetodoDireccional:
 
         :rtype: bool
         """
-        if self.angulo < 10:
-            return True
-        return False
+        return self._normal_como_paralelo
 
     @cached_property
     def zonas(self):
@@ -279,16 +483,7 @@ class CubiertaMetodoDireccional:
             para cada zona.
         :rtype: tuple
         """
-        paralelo = self._zonas_cubierta(
-            self.altura_media, self.longitud
-        )
-        if self.normal_como_paralelo():
-            normal = self._zonas_cubierta(
-                self.altura_media, self.ancho
-            )
-        else:
-            normal = None
-        return {'paralelo': paralelo, 'normal': normal}
+        return {'paralelo': self._zonas_paralelo, 'normal': self._zonas_normal}
 
     @cached_property
     def valores(self):
@@ -297,14 +492,17 @@ class CubiertaMetodoDireccional:
         :returns: ``dict`` con los valores de cp para cubierta.
         :rtype: dict
         """
+        return _valores_cubierta_sprfv(
+            self.ancho, self.longitud, self.altura_media, self.angulo
+        )
+
+    def _calcular_valores(self):
         cp_paralelo = self._cp_cubierta_angulo_menor_diez(
-            self.longitud, self.ancho,
-            len(self.zonas['paralelo'])
+            self.longitud, self.ancho, len(self._zonas_paralelo)
         )
-        if self.normal_como_paralelo():
+        if self._normal_como_paralelo:
             cp_normal = self._cp_cubierta_angulo_menor_diez(
-                self.ancho, self.longitud,
-                len(self.zonas['normal'])
+                self.ancho, self.longitud, len(self._zonas_normal)
             )
         else:
             cp_barlovento = self._cp_cubierta_barlovento()
@@ -329,23 +527,21 @@ class CubiertaMetodoDireccional:
         :param int numero_de_zonas: El numero de zonas de aplicación del viento.
             Este valor debe estar comprendido entre 1 y 4.
 
-        :returns: array con los coeficientes de presión.
-        :rtype: :class:`~numpy:numpy.ndarray`
+        :returns: ``dict`` con los coeficientes de presión para cada zona.
+        :rtype: dict
         """
         area = self._area_cp_cubierta(
             self.altura_media, dimension_paralela, dimension_normal
         )
-        reduccion = np.interp(area, (10, 25, 100), (1, 0.9, 0.8))
-        relaciones_altura_longitud = (0.5, 1)
-        cp = (
-            (-0.9, -1.3 * reduccion), (-0.9, -0.7), (-0.5, -0.7), (-0.3, -0.7)
+        reduccion = interpolar(
+            area, _AREAS_REDUCCION, _FACTORES_REDUCCION
         )
-        cp_iter = (
-            np.interp(self.altura_media / dimension_paralela,
-                      relaciones_altura_longitud, cp_val)
-            for cp_val in cp
+        tabla = _CP_ANGULO_MENOR_DIEZ.copy()
+        tabla[0, -1] *= reduccion
+        valores_cp = _interpolar_filas(
+            self.altura_media / dimension_paralela,
+            _RELACIONES_ANGULO_MENOR_DIEZ, tabla
         )
-        valores_cp = np.fromiter(cp_iter, float)
         nombre_zonas = ('0 a h/2', 'h/2 a h', 'h a 2h', '> 2h')
         return {nombre: valor for valor, nombre in
                 zip(valores_cp[:numero_de_zonas], nombre_zonas)}
@@ -366,41 +562,18 @@ class CubiertaMetodoDireccional:
                 self.altura_media, self.longitud, self.ancho
             )
             # Interpolate the reduction for apply on the cp value based on the area
-            reduccion = np.interp(area, (10, 25, 100), (1, 0.9, 0.8))
-            relaciones_altura_longitud = (0.25, 0.5, 1)
-            angulos = (10, 15, 20, 25, 30, 35, 45, 60, 80)
-            valores_cp_caso_a = (
-                (-0.7, -0.9, -1.3 * reduccion), (-0.5, -0.7, -1),
-                (-0.3, -0.4, -0.7), (-0.2, -0.3, -0.5),
-                (-0.2, -0.2, -0.3), (0, -0.2, -0.2),
-                (0, 0, 0), (0, 0, 0), (0, 0, 0)
-            )
-            valores_cp_caso_b = (
-                (0, 0, 0), (0, 0, 0), (0.2, 0, 0),
-                (0.3, 0.2, 0), (0.3, 0.2, 0.2), (0.4, 0.3, 0.2),
-                (0.4, 0.4, 0.3), (0.6, 0.6, 0.6), (0.8, 0.8, 0.8)
-            )
-            iter_interp_relacion_caso_a = (np.interp(
-                self.altura_media / self.ancho,
-                relaciones_altura_longitud, cp_tuple)
-                for cp_tuple in valores_cp_caso_a
-            )
-            iter_interp_relacion_caso_b = (np.interp(
-                self.altura_media / self.ancho,
-                relaciones_altura_longitud, cp_tuple)
-                for cp_tuple in valores_cp_caso_b
-            )
-            interp_relacion_caso_a = np.fromiter(
-                iter_interp_relacion_caso_a, float
-            )
-            interp_relacion_caso_b = np.fromiter(
-                iter_interp_relacion_caso_b, float
+            reduccion = interpolar(
+                area, _AREAS_REDUCCION, _FACTORES_REDUCCION
             )
-            cp_caso_a = np.interp(
-                self.angulo, angulos, interp_relacion_caso_a
+            interp_relacion_caso_a, interp_relacion_caso_b = \
+                _cp_barlovento_por_angulo(
+                    self.altura_media / self.ancho, reduccion
+                )
+            cp_caso_a = interpolar(
+                self.angulo, _ANGULOS_BARLOVENTO, interp_relacion_caso_a
             )
-            cp_caso_b = np.interp(
-                self.angulo, angulos, interp_relacion_caso_b
+            cp_caso_b = interpolar(
+                self.angulo, _ANGULOS_BARLOVENTO, interp_relacion_caso_b
             )
             return {'caso a': cp_caso_a, 'caso b': cp_caso_b}
         raise ValueError('No se pueden calcular los valores, el ángulo de '
@@ -416,18 +589,10 @@ class CubiertaMetodoDireccional:
         .. note:: Debe ser usado cuando el ángulo de cubierta es ≥ 10°.
         """
         if self.angulo >= 10:
-            relaciones_altura_longitud = (0.25, 0.5, 1)
-            angulos = (10, 15, 20)
-            valores_cp = (
-                (-0.3, -0.5, -0.7), (-0.5, -0.5, -0.6), (-0.6, -0.6, -0.6)
-            )
-            iter_interp_relacion = (np.interp(
-                self.altura_media / self.ancho,
-                relaciones_altura_longitud, cp_tuple) for cp_tuple in valores_cp
+            return interpolar(
+                self.angulo, _ANGULOS_SOTAVENTO,
+                _cp_sotavento_por_angulo(self.altura_media / self.ancho)
             )
-            relation_interp_cp = np.fromiter(iter_interp_relacion, float)
-            cp = np.interp(self.angulo, angulos, relation_interp_cp)
-            return cp
         raise ValueError('No se pueden calcular los valores, el ángulo de '
                          'cubierta debe ser ≥ 10° para usar este método.')
 
@@ -461,18 +626,16 @@ class CubiertaMetodoDireccional:
             para cada zona.
         :rtype: tuple
         """
-        distancia_codigo = (
+        distancia_codigo = np.array((
             0, altura_media_cubierta / 2, altura_media_cubierta,
             2 * altura_media_cubierta, dimension_paralela
-        )
-        distancias_unicas = dedupe(distancia_codigo)
-        distancias_filtradas = tuple(
-            dist for dist in distancias_unicas if dist <= dimension_paralela
-        )
-        zonas = tuple(
-            zona for zona in zip(distancias_filtradas, distancias_filtradas[1:])
-        )
-        return zonas
+        ), dtype=float)
+        # np.unique ordena y elimina las distancias repetidas en una sola
+        # pasada.
+        distancias = np.unique(
+            distancia_codigo[distancia_codigo <= dimension_paralela]
+        ).tolist()
+        return tuple(zip(distancias, distancias[1:]))
 
     def __call__(self):
         return self.valores
@@ -489,24 +652,59 @@ class AleroMetodoDireccional(CubiertaMetodoDireccional):
 
     @cached_property
     def valores(self):
-        valores = super().valores
-        if self.normal_como_paralelo():
-            cps = tuple(cp for cp in valores['normal'].values())
-            cp_barlovento = cps[0] - 0.8
-            cp_sotavento = cps[-1]
-        else:
-            cp_barlovento = {
-                key: valor - 0.8 for key, valor in valores['normal']['barlovento'].items()
-            }
-            cp_sotavento = valores['normal']['sotavento']
-        valores['normal'] = {'barlovento': cp_barlovento, 'sotavento': cp_sotavento}
-        return valores
+        """Calcula los valores de coeficiente de presión para el alero a partir
+        de los de cubierta, que se comparten con :class:`CubiertaMetodoDireccional`.
+
+        :returns: ``dict`` con los valores de cp para el alero.
+        :rtype: dict
+        """
+        return _valores_alero_sprfv(
+            self.ancho, self.longitud, self.altura_media, self.angulo
+        )
 
 
 class AleroMetodoEnvolvente:
     pass
 
 
+# Figuras 5B, 7A y 8 - Coeficientes de presión y áreas de componentes y
+# revestimientos de cubierta para cada caso y zona.
+_CASOS_COMPONENTES_CUBIERTA = solo_lectura({
+    'A': {'1': {'cp': (-1, -0.9)}, '2': {'cp': (-1.8, -1.1)},
+          '3': {'cp': (-2.8, -1.1)}, 'Todas': {'cp': (0.3, 0.2)}},
+    'B': {'1': {'cp': (-0.9, -0.8)}, '2': {'cp': (-2.1, -1.4)},
+          '3': {'cp': (-2.1, -1.4)}, 'Todas': {'cp': (0.5, 0.3)}},
+    'C': {'1': {'cp': (-1, -0.8)}, '2': {'cp': (-1.2, -1)},
+          '3': {'cp': (-1.2, -1)}, 'Todas': {'cp': (0.9, 0.8)}},
+    'D': {'1': {'cp': (-1.1, -1.1)}, '2': {'cp': (-1.3, -1.2)},
+          '3': {'cp': (-1.8, -1.2)}, "2'": {'cp': (-1.6, -1.5)},
+          "3'": {'cp': (-2.6, -1.6)}, 'Todas': {'cp': (0.3, 0.2)}},
+    'E': {'1': {'cp': (-1.3, -1.1)}, '2': {'cp': (-1.6, -1.2)},
+          '3': {'cp': (-2.9, -2)}, 'Todas': {'cp': (0.4, 0.3)}},
+    'F': {'1': {'cp': (-1.4, -0.9)}, '2': {'cp': (-2.3, -1.6)},
+          '3': {'cp': (-3.2, -2.3)}}
+})
+
+# Zonas que cambian cuando la cubierta tiene alero.
+_CASOS_COMPONENTES_ALERO = solo_lectura({
+    'A': {
+        '1': {'cp': ((-1.7, -1.6), (-1.6, -1.1)),
+              'area': ((1, 10), (10, 50))},
+        '2': {'cp': ((-1.7, -1.6), (-1.6, -1.1)),
+              'area': ((1, 10), (10, 50))},
+        '3': {'cp': (-2.8, -0.8)}
+    },
+    'B': {
+        '2': {'cp': (-2.2, -2.2)},
+        '3': {'cp': (-3.7, -2.5)}
+    },
+    'C': {
+        '2': {'cp': (-2.0, -1.8)},
+        '3': {'cp': (-2.0, -1.8)}
+    }
+})
+
+
 class CubiertaDosAguasPlanaComponentes:
     """Esta clase utiliza para determinar los coeficientes de presión de cubierta
     a dos aguas y plana de edificio para Componentes y Revestimientos.
@@ -550,42 +748,9 @@ class CubiertaDosAguasPlanaComponentes:
                 'No hay componentes para determinar los coeficientes de presión'
             )
         caso = self._caso()
-        casos = {
-            'A': {'1': {'cp': (-1, -0.9)}, '2': {'cp': (-1.8, -1.1)},
-                  '3': {'cp': (-2.8, -1.1)}, 'Todas': {'cp': (0.3, 0.2)}},
-            'B': {'1': {'cp': (-0.9, -0.8)}, '2': {'cp': (-2.1, -1.4)},
-                  '3': {'cp': (-2.1, -1.4)}, 'Todas': {'cp': (0.5, 0.3)}},
-            'C': {'1': {'cp': (-1, -0.8)}, '2': {'cp': (-1.2, -1)},
-                  '3': {'cp': (-1.2, -1)}, 'Todas': {'cp': (0.9, 0.8)}},
-            'D': {'1': {'cp': (-1.1, -1.1)}, '2': {'cp': (-1.3, -1.2)},
-                  '3': {'cp': (-1.8, -1.2)}, "2'": {'cp': (-1.6, -1.5)},
-                  "3'": {'cp': (-2.6, -1.6)}, 'Todas': {'cp': (0.3, 0.2)}},
-            'E': {'1': {'cp': (-1.3, -1.1)}, '2': {'cp': (-1.6, -1.2)},
-                  '3': {'cp': (-2.9, -2)}, 'Todas': {'cp': (0.4, 0.3)}},
-            'F': {'1': {'cp': (-1.4, -0.9)}, '2': {'cp': (-2.3, -1.6)},
-                  '3': {'cp': (-3.2, -2.3)}}
-        }
+        caso_cp = dict(_CASOS_COMPONENTES_CUBIERTA[caso])
         if self.alero:
-            casos_alero = {
-                'A': {
-                    '1': {'cp': ((-1.7, -1.6), (-1.6, -1.1)),
-                          'area': ((1, 10), (10, 50))},
-                    '2': {'cp': ((-1.7, -1.6), (-1.6, -1.1)),
-                          'area': ((1, 10), (10, 50))},
-                    '3': {'cp': (-2.8, -0.8)}
-                },
-                'B': {
-                    '2': {'cp': (-2.2, -2.2)},
-                    '3': {'cp': (-3.7, -2.5)}
-                },
-                'C': {
-                    '2': {'cp': (-2.0, -1.8)},
-                    '3': {'cp': (-2.0, -1.8)}
-                }
-            }
-            for caso_alero, diccionario in casos_alero.items():
-                casos[caso_alero].update(diccionario)
-        caso_cp = casos[caso]
+            caso_cp.update(_CASOS_COMPONENTES_ALERO.get(caso, {}))
         if caso in ('A', 'F') and self.parapeto > 1:
             # CIRSOC 102 - 2005 (Fig. 5B -Nota de pie 5 y Fig. 8 Nota de pie 7)
             caso_cp['3'] = caso_cp['2']
@@ -595,16 +760,16 @@ class CubiertaDosAguasPlanaComponentes:
         else:
             # Areas techo pequeñas alturas -CIRSOC 102 (2005) Fig. 5B)
             area = (1, 10)
-        valor_cp = defaultdict(dict)
-        for nombre, area_componente in self.componentes.items():
-            for zona, cps in caso_cp.items():
-                cp = cps['cp']
-                areas = cps.get('area', area)
-                cp_filtrado, area_filtrada = filtrar_cp_areas(cp, areas, area_componente)
-                valor_cp[nombre][zona] = calcular_cp_cr(
-                    cp_filtrado, area_filtrada, area_componente
-                )
-        return valor_cp
+        zonas = tuple(
+            (zona, _rangos_cp_cr(cps['cp'], cps.get('area', area)))
+            for zona, cps in caso_cp.items()
+        )
+        return {
+            nombre: {
+                zona: _cp_cr_desde_rangos(rangos, area_componente)
+                for zona, rangos in zonas
+            } for nombre, area_componente in self.componentes.items()
+        }
 
     @cached_property
     def referencia(self):
@@ -702,6 +867,8 @@ class Paredes:
 
     .. note:: Todos los parámetros numéricos deben ser positivos.
     """
+    __slots__ = ('sprfv', 'componentes')
+
     def __init__(self, ancho, longitud, altura_media, angulo_cubierta,
                  componentes=None, metodo_sprfv='direccional'):
         self.sprfv = self.selector_sprfv(ancho, longitud, metodo_sprfv)
@@ -743,6 +910,8 @@ class Cubierta:
 
     .. note:: Todos los parámetros numéricos deben ser positivos.
     """
+    __slots__ = ('sprfv', 'componentes')
+
     def __init__(self, ancho, longitud, altura_media, angulo, tipo_cubierta,
                  parapeto=0, alero=0, componentes=None,
                  metodo_sprfv='direccional'):
@@ -794,6 +963,8 @@ class Alero:
 
     .. note:: Todos los parámetros numéricos deben ser positivos.
     """
+    __slots__ = ('sprfv',)
+
     def __init__(self, ancho, longitud, altura_media, angulo,
                  metodo_sprfv='direccional'):
         self.sprfv = self.selector_sprfv(
@@ -834,6 +1005,8 @@ class Edificio:
         de presión para el SPRFV. Default=direccional.
         Valores aceptados = (direccional, envolvente).
     """
+    __slots__ = ('paredes', 'cubierta', 'alero')
+
     def __init__(self, ancho, longitud, altura_media, angulo_cubierta,
                  tipo_cubierta, alero=0, parapeto=0, componentes_paredes=None,
                  componentes_cubierta=None, metodo_sprfv='direccional'):
@@ -0,0 +1,52 @@
+# Copyright (c) 2019, Eduardo Di Loreto <efdiloreto@gmail.com>
+
+# This file is part of Zonda.
+
+# Zonda is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# Zonda is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_left
+from types import MappingProxyType
+
+
+def interpolar(x, xs, ys):
+    """Interpola linealmente un valor en una tabla ordenada.
+
+    Equivale a :func:`numpy.interp` para un único valor, pero evita convertir
+    las tablas a arrays en cada llamada.
+
+    :param float x: El valor a interpolar.
+    :param tuple xs: Los valores de abscisa, en orden creciente.
+    :param tuple ys: Los valores de ordenada.
+
+    :rtype: float
+    """
+    i = bisect_left(xs, x)
+    if i == 0:
+        return ys[0]
+    if i == len(xs):
+        return ys[-1]
+    x0, x1 = xs[i - 1], xs[i]
+    return ys[i - 1] + (ys[i] - ys[i - 1]) * (x - x0) / (x1 - x0)
+
+
+def solo_lectura(valores):
+    """Convierte un ``dict`` anidado en :class:`types.MappingProxyType` en
+    todos sus niveles, para que pueda compartirse entre instancias.
+
+    :rtype: types.MappingProxyType
+    """
+    return MappingProxyType({
+        clave: solo_lectura(valor) if isinstance(valor, dict) else valor
+        for clave, valor in valores.items()
+    })
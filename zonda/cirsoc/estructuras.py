@@ -21,7 +21,23 @@ from .factores import Topografia, Rafaga
 from . import presiones as pr
 
 
+# Argumentos opcionales que se guardan en las estructuras y que son utilizados
+# por los factores de ráfaga y topográfico.
+_ARGS_FACTORES = (
+    'frecuencia', 'beta', 'flexibilidad', 'tipo_terreno', 'altura_terreno',
+    'distancia_cresta', 'distancia_barlovento_sotavento', 'direccion'
+)
+
+
 class Cartel:
+    _args_aceptados = _ARGS_FACTORES + ('alturas_personalizadas', 'es_parapeto')
+    __slots__ = (
+        'ancho', 'profundidad', 'altura_inferior', 'altura_superior',
+        'velocidad', 'categoria_exp', 'factor_g_simplificado',
+        'considerar_topografia', 'categoria', 'geometria', 'cf', 'rafaga',
+        'topografia', 'presiones'
+    ) + _args_aceptados
+
     def __init__(self, profundidad, ancho, altura_inferior, altura_superior,
                  velocidad, categoria_exp, factor_g_simplificado,
                  considerar_topografia, categoria, **kwargs):
@@ -34,7 +50,9 @@ class Cartel:
         self.factor_g_simplificado = factor_g_simplificado
         self.considerar_topografia = considerar_topografia
         self.categoria = categoria
-        self.__dict__.update(kwargs)
+        for key, valor in kwargs.items():
+            if key in self._args_aceptados:
+                setattr(self, key, valor)
         alturas_personalizadas = kwargs.get('alturas_personalizadas')
         es_parapeto = kwargs.get('es_parapeto', False)
         self.geometria = ge.Cartel(
@@ -62,6 +80,14 @@ class Cartel:
 
 
 class CubiertaAislada:
+    _args_aceptados = _ARGS_FACTORES
+    __slots__ = (
+        'ancho', 'longitud', 'altura_alero', 'altura_cumbrera', 'altura_bloqueo',
+        'tipo_cubierta', 'posicion_bloqueo', 'velocidad', 'categoria_exp',
+        'factor_g_simplificado', 'considerar_topografia', 'categoria',
+        'geometria', 'cpn', 'rafaga', 'topografia', 'presiones'
+    ) + _args_aceptados
+
     def __init__(self, ancho, longitud, altura_alero, altura_bloqueo,
                  posicion_bloqueo, altura_cumbrera, tipo_cubierta, velocidad,
                  categoria_exp, factor_g_simplificado, considerar_topografia,
@@ -78,7 +104,9 @@ class CubiertaAislada:
         self.factor_g_simplificado = True
         self.considerar_topografia = considerar_topografia
         self.categoria = categoria
-        self.__dict__.update(kwargs)
+        for key, valor in kwargs.items():
+            if key in self._args_aceptados:
+                setattr(self, key, valor)
         self.geometria = ge.cubiertas.cubierta(
             tipo_cubierta, ancho, longitud, altura_alero,
             altura_cumbrera=altura_cumbrera, altura_bloqueo=altura_bloqueo,
@@ -100,6 +128,18 @@ class CubiertaAislada:
 
 
 class Edificio:
+    _args_aceptados = _ARGS_FACTORES + (
+        'altura_cumbrera', 'ancho_central', 'alero', 'parapeto',
+        'alturas_personalizadas', 'componentes_paredes', 'componentes_cubierta',
+        'volumen_interno', 'aberturas'
+    )
+    __slots__ = (
+        'ancho', 'longitud', 'elevacion', 'altura_alero', 'tipo_cubierta',
+        'metodo_sprfv', 'velocidad', 'categoria_exp', 'factor_g_simplificado',
+        'considerar_topografia', 'cerramiento', 'categoria', 'reducir_gcpi',
+        'geometria', 'cp', 'rafaga', 'topografia', 'presiones'
+    ) + _args_aceptados
+
     def __init__(self, ancho, longitud, elevacion, altura_alero, tipo_cubierta,
                  metodo_sprfv, velocidad, categoria_exp, factor_g_simplificado,
                  considerar_topografia, cerramiento, categoria, reducir_gcpi=False,
@@ -117,7 +157,9 @@ class Edificio:
         self.cerramiento = cerramiento
         self.categoria = categoria
         self.reducir_gcpi = reducir_gcpi
-        self.__dict__.update(kwargs)
+        for key, valor in kwargs.items():
+            if key in self._args_aceptados:
+                setattr(self, key, valor)
         self.geometria = ge.edificios(
             ancho, longitud, elevacion, altura_alero, tipo_cubierta, **kwargs
         )
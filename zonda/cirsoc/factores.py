@@ -15,10 +15,10 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
 from collections import namedtuple
+from functools import cached_property
+from math import exp, log, sqrt
 import numpy as np
-from cached_property import cached_property
 
 
 _Constantes = namedtuple(
@@ -37,6 +37,53 @@ _constantes_exposicion = {
     'D': _Constantes(11.5, 213, 1 / 11.5, 1.07, 1 / 9, 0.8, 0.15, 198, 1 / 8, 2.1)
 }
 
+# Referencia = CIRSOC 102-2005 Fig. 2
+_param_topo_vel = {
+    'loma bidimensional': {'factor_k': {'A': 1.3, 'B': 1.3, 'C': 1.45, 'D': 1.55},
+                           'gamma': 3, 'mu': {'barlovento': 1.5, 'sotavento': 1.5}},
+    'escarpa bidimensional': {'factor_k': {'A': 0.75, 'B': 0.75, 'C': 0.85, 'D': 0.95},
+                              'gamma': 2.5, 'mu': {'barlovento': 1.5, 'sotavento': 4}},
+    'colina tridimensional': {'factor_k': {'A': 0.95, 'B': 0.95, 'C': 1.05, 'D': 1.15},
+                              'gamma': 4, 'mu': {'barlovento': 1.5, 'sotavento': 1.5}}
+}
+
+
+def _ri(n):
+    """Calcula la función de admitancia aerodinámica Rh, Rb o Rl.
+
+    :param float n: El parámetro reducido nh, nb o nl.
+    :rtype: float
+    """
+    if n > 0:
+        return 1 / n - (1 - exp(-2 * n)) / (2 * n * n)
+    return 1
+
+
+def _parametros_flexible(lz, vz, frecuencia, altura, ancho, longitud, beta):
+    """Calcula los parámetros de respuesta resonante de una estructura flexible.
+
+    :param float lz: La escala integral de longitud de la turbulencia.
+    :param float vz: La velocidad media horaria a la altura equivalente.
+    :param float frecuencia: La frecuencia natural de la estructura en hz.
+    :param float altura: La altura de la estructura.
+    :param float ancho: El ancho de la estructura.
+    :param float longitud: La longitud de la estructura.
+    :param float beta: La relación de amortiguamiento crítico.
+
+    :returns: El factor de pico para la respuesta resonante y el factor de
+        respuesta resonante.
+    :rtype: tuple
+    """
+    raiz_log = sqrt(2 * log(3600 * frecuencia))
+    gr = raiz_log + 0.577 / raiz_log
+    n1 = frecuencia * lz / vz
+    rn = 7.47 * n1 / ((1 + 10.3 * n1) ** (5 / 3))
+    rh = _ri(4.6 * frecuencia * altura / vz)
+    rb = _ri(4.6 * frecuencia * ancho / vz)
+    rl = _ri(15.4 * frecuencia * longitud / vz)
+    r = sqrt(rn * rh * rb * (0.53 + 0.47 * rl) / beta)
+    return gr, r
+
 
 class Rafaga:
     """Clase Rafaga.
@@ -61,18 +108,22 @@ class Rafaga:
     :param str categoria_exp: La categoría de exposición.
         Valores aceptados = (A, B, C, D)
     """
+    _args_aceptados = (
+        'ancho', 'longitud', 'altura', 'altura_rafaga', 'velocidad',
+        'frecuencia', 'beta', 'flexibilidad'
+    )
+
     def __init__(self, factor_g_simplificado, categoria_exp, **kwargs):
-        args_aceptados = (
-            'ancho', 'longitud', 'altura', 'altura_rafaga', 'velocidad',
-            'frecuencia', 'beta', 'flexibilidad'
-        )
         self.factor_g_simplificado = factor_g_simplificado
         self.categoria_exp = categoria_exp
         self.constantes_exp_terreno = _constantes_exposicion[self.categoria_exp]
-        if not factor_g_simplificado:
-            for key, valor in kwargs.items():
-                if key in args_aceptados:
-                    setattr(self, key, valor)
+        if factor_g_simplificado:
+            # Se asigna directamente, anulando el calculo de :attr:`factor`.
+            self.factor = 0.85
+            return
+        for key, valor in kwargs.items():
+            if key in self._args_aceptados:
+                setattr(self, key, valor)
 
     @cached_property
     def parametros(self):
@@ -82,25 +133,16 @@ class Rafaga:
         :rtype: tuple
         """
         parametros_rafaga = namedtuple('ParametrosRafaga', 'z iz lz gr r')
-        z = max(self.altura_rafaga, self.constantes_exp_terreno.zmin)
-        iz = self.constantes_exp_terreno.c * ((10 / z) ** (1 / 6))
-        lz = self.constantes_exp_terreno.le * \
-            ((z / 10) ** self.constantes_exp_terreno.ep_bar)
+        constantes = self.constantes_exp_terreno
+        z = max(self.altura_rafaga, constantes.zmin)
+        iz = constantes.c * ((10 / z) ** (1 / 6))
+        lz = constantes.le * ((z / 10) ** constantes.ep_bar)
         if self.flexibilidad == 'flexible':
-            gr = (2 * math.log(3600 * self.frecuencia)) ** 0.5 + 0.577 / (
-                (2 * math.log(3600 * self.frecuencia)) ** 0.5)
-            vz = self.constantes_exp_terreno.b_bar * \
-                ((z / 10) ** self.constantes_exp_terreno.alpha_bar) * self.velocidad
-            n1 = self.frecuencia * lz / vz
-            rn = 7.47 * n1 / ((1 + 10.3 * n1) ** (5 / 3))
-            nh = 4.6 * self.frecuencia * self.altura / vz
-            nb = 4.6 * self.frecuencia * self.ancho / vz
-            nl = 15.4 * self.frecuencia * self.longitud / vz
-            n = (nh, nb, nl)
-            ri = [1 / j - ((1 - np.e ** (-2 * j)) / (2 * j ** 2)) if j > 0
-                  else 1 for j in n]
-            rh, rb, rl = ri
-            r = (rn * rh * rb * (0.53 + 0.47 * rl) / self.beta) ** 0.5
+            vz = constantes.b_bar * ((z / 10) ** constantes.alpha_bar) * self.velocidad
+            gr, r = _parametros_flexible(
+                lz, vz, self.frecuencia, self.altura, self.ancho, self.longitud,
+                self.beta
+            )
             return parametros_rafaga(z, iz, lz, gr, r)
         return parametros_rafaga(z, iz, lz, None, None)
 
@@ -110,8 +152,8 @@ class Rafaga:
 
         :rtype: float
         """
-        factor_q = (1 / (1 + 0.63 * ((self.longitud + self.altura) /
-                         self.parametros.lz) ** 0.63)) ** 0.5
+        factor_q = sqrt(1 / (1 + 0.63 * ((self.longitud + self.altura) /
+                        self.parametros.lz) ** 0.63))
         return factor_q
 
     def _rigida(self):
@@ -119,8 +161,8 @@ class Rafaga:
 
         :rtype: float
         """
-        g = ((1 + 1.7 * 3.4 * self.parametros.iz * self.factor_q) /
-             (1 + 1.7 * 3.4 * self.parametros.iz)) * 0.925
+        iz = self.parametros.iz
+        g = ((1 + 1.7 * 3.4 * iz * self.factor_q) / (1 + 1.7 * 3.4 * iz)) * 0.925
         return g
 
     def _flexible(self):
@@ -128,21 +170,21 @@ class Rafaga:
 
         :rtype: float
         """
-        g = ((1 + 1.7 * self.parametros.iz * ((
-            (3.4 * self.factor_q) ** 2 +
-            (self.parametros.gr * self.parametros.r) ** 2) ** 0.5)) /
-            (1 + 1.7 * 3.4 * self.parametros.iz)) * 0.925
+        parametros = self.parametros
+        iz = parametros.iz
+        g = ((1 + 1.7 * iz * sqrt(
+            (3.4 * self.factor_q) ** 2 + (parametros.gr * parametros.r) ** 2)) /
+            (1 + 1.7 * 3.4 * iz)) * 0.925
         return g
 
     @cached_property
     def factor(self):
         """Calcula el factor de ráfaga de acuerdo a la flexibilidad de la
-        estructura o si es considerado simplificado o no.
+        estructura. Si es considerado simplificado, el valor 0.85 se asigna al
+        crear la instancia.
 
         :rtype: float
         """
-        if self.factor_g_simplificado:
-            return 0.85
         if self.flexibilidad == 'flexible':
             return self._flexible()
         return self._rigida()
@@ -215,6 +257,14 @@ class Topografia:
     def topografia_considerada(self):
         """Chequea si es necesario considerar la topografia.
 
+        :rtype: bool
+        """
+        return self._considerar
+
+    @cached_property
+    def _considerar(self):
+        """Evalúa una única vez si es necesario considerar la topografia.
+
         :rtype: bool
         """
         if not self.considerar_topografia:
@@ -232,29 +282,17 @@ class Topografia:
         :returns: ``namedtuple`` con los parámetros del factor topográfico.
         :rtype: tuple
         """
-        # Referencia = CIRSOC 102-2005 Fig. 2
-        param_topo_vel = {
-            'loma bidimensional': {'factor_k': {'A': 1.3, 'B': 1.3,
-                                                'C': 1.45, 'D': 1.55},
-                                   'gamma': 3, 'mu': {'barlovento': 1.5,
-                                                      'sotavento': 1.5}},
-            'escarpa bidimensional': {'factor_k': {'A': 0.75, 'B': 0.75,
-                                                   'C': 0.85, 'D': 0.95},
-                                      'gamma': 2.5, 'mu': {'barlovento': 1.5,
-                                                           'sotavento': 4}},
-            'colina tridimensional': {'factor_k': {'A': 0.95, 'B': 0.95,
-                                                   'C': 1.05, 'D': 1.15},
-                                      'gamma': 4, 'mu': {'barlovento': 1.5,
-                                                         'sotavento': 1.5}}
-        }
         # Lh Referencia: CiIRSOC 102 2005 Fig. 2 Nota 2
         lh = max(self.distancia_cresta, 2 * self.altura_terreno)
-        k_factor = param_topo_vel[self.tipo_terreno]['factor_k'][self.categoria_exp]
-        gamma = param_topo_vel[self.tipo_terreno]['gamma']
-        mu = param_topo_vel[self.tipo_terreno]['mu'][self.direccion]
+        param_terreno = _param_topo_vel[self.tipo_terreno]
+        k_factor = param_terreno['factor_k'][self.categoria_exp]
+        gamma = param_terreno['gamma']
+        mu = param_terreno['mu'][self.direccion]
         k1 = k_factor * self.altura_terreno / lh
         k2 = 1 - self.distancia_barlovento_sotavento / mu / lh
-        k3 = np.e ** (-1 * gamma * self.alturas / lh)
+        k3 = -gamma / lh * self.alturas
+        # La exponencial se calcula sobre el mismo array cuando hay varias alturas.
+        k3 = np.exp(k3, out=k3 if isinstance(k3, np.ndarray) else None)
         return _ParametrosTopograficos(k_factor, gamma, mu, lh, k1, k2, k3)
 
     @cached_property
@@ -266,9 +304,9 @@ class Topografia:
             un float.
         :rtype: :class:`~numpy:numpy.ndarray` o float
         """
-        if not self.topografia_considerada():
+        if not self._considerar:
             try:
-                kzt = np.fromiter((1 for i in range(len(self.alturas))), float)
+                kzt = np.ones(len(self.alturas), dtype=float)
             except TypeError:
                 kzt = 1.00
             return kzt
@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-from cached_property import cached_property
+import numpy as np
 from .utilidades import array_alturas
 
 
@@ -38,51 +38,16 @@ class Cartel:
         self.altura_inferior = altura_inferior
         self.altura_superior = altura_superior
         self.alturas_personalizadas = alturas_personalizadas
-
-    @cached_property
-    def altura_neta(self):
-        """Calcula la altura de la superficie del cartel donde pega el viento.
-
-        :rtype: float
-        """
-        return self.altura_superior - self.altura_inferior
-
-    @cached_property
-    def area(self):
-        """Calcula el area del cartel.
-
-        :rtype: float
-        """
-        return self.ancho * self.altura_neta
-
-    @cached_property
-    def altura_media(self):
-        """Calcula la altura media del cartel
-
-        :rtype: float
-        """
-        return (self.altura_inferior + self.altura_superior) / 2
-
-    @cached_property
-    def alturas(self):
-        """Crea un array de alturas desde :attr:`elevacion` a
-        :attr:`altura_superior`.
-
-        :returns: Un array de alturas ordenada.
-        :rtype: :class:`~numpy:numpy.ndarray`
-        """
-        alturas = array_alturas(
-            self.altura_inferior, self.altura_superior, self.alturas_personalizadas
-        )
-        return alturas
-
-    @cached_property
-    def areas_parciales(self):
-        areas = tuple(
-            self.ancho * (area_sup - area_inf) for area_inf, area_sup
-            in zip(self.alturas, self.alturas[1:])
+        # La altura de la superficie del cartel donde pega el viento.
+        self.altura_neta = altura_superior - altura_inferior
+        self.area = ancho * self.altura_neta
+        self.altura_media = (altura_inferior + altura_superior) / 2
+        # Array ordenado de alturas desde la altura inferior a la superior y las
+        # areas del cartel entre alturas consecutivas.
+        self.alturas = array_alturas(
+            altura_inferior, altura_superior, alturas_personalizadas
         )
-        return areas
+        self.areas_parciales = ancho * np.diff(self.alturas)
 
     def __repr__(self):
         return f'<{self.__name__}(profundidad={self.profundidad}, ancho={self.ancho},' \
@@ -15,8 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
+import inspect
 import math
-from cached_property import cached_property
+from ..utilidades import propiedad_cacheada
 
 
 class CubiertaPlana:
@@ -37,9 +38,15 @@ class CubiertaPlana:
     """
 
     tipo = 'plana'
+    __slots__ = (
+        'ancho', 'longitud', 'altura_alero', 'parapeto', 'alero',
+        'componentes_cubierta', 'altura_bloqueo', '_cache_relacion_bloqueo',
+        '_cache_angulo', '_cache_area', '_cache_altura_media',
+        '_cache_area_mojinete'
+    )
 
     def __init__(self, ancho, longitud, altura_alero, parapeto=0, alero=0,
-                 altura_bloqueo=0, componentes_cubierta=None, **kwargs):
+                 altura_bloqueo=0, componentes_cubierta=None):
         self.ancho = ancho
         self.longitud = longitud
         self.altura_alero = altura_alero
@@ -48,11 +55,17 @@ class CubiertaPlana:
         self.componentes_cubierta = componentes_cubierta
         self.altura_bloqueo = altura_bloqueo
 
-    @cached_property
+    @propiedad_cacheada
     def relacion_bloqueo(self):
-        return min(self.altura_bloqueo / self.altura_alero, 1)
+        """Calcula la relación entre la altura de bloqueo y la altura de alero.
 
-    @cached_property
+        :rtype: float
+        """
+        if not self.altura_bloqueo:
+            return 0.0
+        return min(self.altura_bloqueo / self.altura_alero, 1.0)
+
+    @propiedad_cacheada
     def angulo(self):
         """Calcula el ángulo de la cubierta.
 
@@ -61,7 +74,7 @@ class CubiertaPlana:
         """
         return 0
 
-    @cached_property
+    @propiedad_cacheada
     def area(self):
         """Calcula el área de la cubierta.
 
@@ -69,7 +82,7 @@ class CubiertaPlana:
         """
         return self.ancho * self.longitud
 
-    @cached_property
+    @propiedad_cacheada
     def altura_media(self):
         """Calcula la altura media de cubierta.
 
@@ -78,7 +91,7 @@ class CubiertaPlana:
         """
         return self.altura_alero
 
-    @cached_property
+    @propiedad_cacheada
     def area_mojinete(self):
         """Calcula el area de la zona de mojinete de la pared.
 
@@ -86,6 +99,23 @@ class CubiertaPlana:
         """
         return 0
 
+    @property
+    def altura_pared_izquierda(self):
+        """Retorna la altura de la pared izquierda del edificio que contiene a la
+        cubierta.
+
+        :rtype: float
+        """
+        return self.altura_alero
+
+    @property
+    def altura_superior(self):
+        """Retorna la altura del punto más alto de la cubierta.
+
+        :rtype: float
+        """
+        return self.altura_alero
+
     def __repr__(self):
         return f'<{self.__name__}(longitud={self.longitud}, ancho={self.ancho},' \
             f' altura_alero={self.altura_alero})>'
@@ -113,35 +143,55 @@ class CubiertaDosAguas(CubiertaPlana):
     """
 
     tipo = 'dos aguas'
+    __slots__ = ('altura_cumbrera', '_altura_faldon', '_ancho_faldon')
 
     def __init__(self, ancho, longitud, altura_alero, altura_cumbrera,
                  parapeto=0, alero=0, altura_bloqueo=0,
-                 componentes_cubierta=None, **kwargs):
+                 componentes_cubierta=None):
         super().__init__(ancho, longitud, altura_alero, parapeto, alero,
                          altura_bloqueo, componentes_cubierta)
         self.altura_cumbrera = altura_cumbrera
+        # Altura y proyección horizontal de cada faldón de la cubierta.
+        self._altura_faldon = altura_cumbrera - altura_alero
+        self._ancho_faldon = ancho / 2
 
-    @cached_property
+    @propiedad_cacheada
     def angulo(self):
         """Calcula el ángulo de la cubierta.
 
         :rtype: float
         """
-        pendiente = (self.altura_cumbrera - self.altura_alero) / self.ancho
-        angulo = math.atan(2 * pendiente)
-        return math.degrees(angulo)
+        pendiente = self._altura_faldon / self._ancho_faldon
+        return math.degrees(math.atan(pendiente))
 
-    @cached_property
+    @propiedad_cacheada
     def area(self):
         """Calcula el área de la cubierta.
 
         :rtype: float
         """
-        altura = self.altura_cumbrera - self.altura_alero
-        perimetro_frontal = 2 * math.hypot(altura, self.ancho / 2)
+        perimetro_frontal = 2 * self._longitud_faldon()
         return perimetro_frontal * self.longitud
 
-    @cached_property
+    def _longitud_faldon(self):
+        """Calcula la longitud inclinada de un faldón de la cubierta.
+
+        Se usa :func:`math.hypot`, que es numéricamente estable y más rápido que
+        :func:`numpy.hypot` para valores escalares.
+
+        :rtype: float
+        """
+        return math.hypot(self._altura_faldon, self._ancho_faldon)
+
+    @property
+    def altura_superior(self):
+        """Retorna la altura del punto más alto de la cubierta.
+
+        :rtype: float
+        """
+        return self.altura_cumbrera
+
+    @propiedad_cacheada
     def altura_media(self):
         """Calcula la altura media de cubierta.
 
@@ -151,7 +201,7 @@ class CubiertaDosAguas(CubiertaPlana):
             return self.altura_alero
         return (self.altura_alero + self.altura_cumbrera) / 2
 
-    @cached_property
+    @propiedad_cacheada
     def area_mojinete(self):
         """Calcula el area de la zona de mojinete de la pared.
 
@@ -190,36 +240,35 @@ class CubiertaUnAgua(CubiertaDosAguas):
     """
 
     tipo = 'un agua'
+    __slots__ = ('posicion_bloqueo',)
 
     def __init__(self, ancho, longitud, altura_alero, altura_cumbrera,
                  parapeto=0, alero=0, altura_bloqueo=0,
                  posicion_bloqueo='alero mas bajo',
-                 componentes_cubierta=None, **kwargs):
+                 componentes_cubierta=None):
         super().__init__(ancho, longitud, altura_alero, altura_cumbrera,
                          parapeto, alero, altura_bloqueo, componentes_cubierta)
-        self.altura_cumbrera = altura_cumbrera
         self.posicion_bloqueo = posicion_bloqueo
+        # La cubierta tiene un único faldón que cubre todo el ancho.
+        self._ancho_faldon = ancho
 
-    @cached_property
-    def angulo(self):
-        """Calcula el ángulo de la cubierta.
+    @propiedad_cacheada
+    def area(self):
+        """Calcula el área de la cubierta.
 
-        :returns: El ángulo de la cubierta en grados.
         :rtype: float
         """
-        pendiente = (self.altura_cumbrera - self.altura_alero) / self.ancho
-        angulo = math.atan(pendiente)
-        return math.degrees(angulo)
+        perimetro_frontal = self._longitud_faldon()
+        return perimetro_frontal * self.longitud
 
-    @cached_property
-    def area(self):
-        """Calcula el área de la cubierta.
+    @property
+    def altura_pared_izquierda(self):
+        """Retorna la altura de la pared izquierda del edificio que contiene a la
+        cubierta. Se considera que la cumbrera esta del lado de la pared izquierda.
 
         :rtype: float
         """
-        altura = self.altura_cumbrera - self.altura_alero
-        perimetro_frontal = math.hypot(altura, self.ancho)
-        return perimetro_frontal * self.longitud
+        return self.altura_cumbrera
 
     def __str__(self):
         return 'Cubierta a Un Agua'
@@ -245,44 +294,26 @@ class CubiertaMansarda(CubiertaDosAguas):
     """
 
     tipo = 'mansarda'
+    __slots__ = ('ancho_central',)
 
     def __init__(self, ancho, longitud, altura_alero, altura_cumbrera,
                  ancho_central, parapeto=0, alero=0, altura_bloqueo=0,
-                 componentes_cubierta=None, **kwargs):
+                 componentes_cubierta=None):
         super().__init__(ancho, longitud, altura_alero, altura_cumbrera, parapeto,
                          alero, altura_bloqueo, componentes_cubierta)
         self.ancho_central = ancho_central
+        # El ancho disponible para calcular el angulo de cubierta.
+        self._ancho_faldon = (ancho - ancho_central) / 2
 
-    @cached_property
-    def angulo(self):
-        """Calcula el ángulo de la cubierta.
-
-        :returns: El ángulo de la cubierta en grados.
-        :rtype: float
-        """
-        pendiente = (self.altura_cumbrera - self.altura_alero) / self._ancho_util
-        angulo = math.atan(pendiente)
-        return math.degrees(angulo)
-
-    @cached_property
+    @propiedad_cacheada
     def area(self):
         """Calcula el área de la cubierta.
 
         :rtype: float
         """
-        altura = self.altura_cumbrera - self.altura_alero
-        perimetro_frontal = 2 * math.hypot(altura, self._ancho_util()) + \
-            self.ancho_central
+        perimetro_frontal = 2 * self._longitud_faldon() + self.ancho_central
         return perimetro_frontal * self.longitud
 
-    @cached_property
-    def _ancho_util(self):
-        """Calcula el ancho disponible para calcular el angulo de cubierta.
-
-        :rtype: float
-        """
-        return (self.ancho - self.ancho_central) / 2
-
     def __repr__(self):
         return f'<{self.__name__}(longitud={self.longitud}, ancho={self.ancho},' \
             f' altura_alero={self.altura_alero},' \
@@ -293,6 +324,19 @@ class CubiertaMansarda(CubiertaDosAguas):
         return 'Cubierta a la Mansarda'
 
 
+_CUBIERTAS = {
+    'plana': CubiertaPlana, 'dos aguas': CubiertaDosAguas,
+    'un agua': CubiertaUnAgua, 'mansarda': CubiertaMansarda
+}
+
+# Los argumentos aceptados por cada tipo de cubierta. Se usan para descartar
+# los argumentos que corresponden a otras partes de la estructura.
+_ARGS_CUBIERTAS = {
+    tipo: frozenset(inspect.signature(clase).parameters)
+    for tipo, clase in _CUBIERTAS.items()
+}
+
+
 def cubierta(tipo, ancho, longitud, altura_alero, **kwargs):
     """Construye una cubierta.
 
@@ -314,8 +358,8 @@ def cubierta(tipo, ancho, longitud, altura_alero, **kwargs):
 
     .. note:: Todos los parámetros numéricos deben ser positivos.
     """
-    cubiertas = {
-        'plana': CubiertaPlana, 'dos aguas': CubiertaDosAguas,
-        'un agua': CubiertaUnAgua, 'mansarda': CubiertaMansarda
+    args_aceptados = _ARGS_CUBIERTAS[tipo]
+    kwargs = {
+        key: valor for key, valor in kwargs.items() if key in args_aceptados
     }
-    return cubiertas[tipo](ancho, longitud, altura_alero, **kwargs)
+    return _CUBIERTAS[tipo](ancho, longitud, altura_alero, **kwargs)
@@ -16,7 +16,9 @@
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
 from collections import namedtuple
-from cached_property import cached_property
+import inspect
+import numpy as np
+from ..utilidades import propiedad_cacheada
 from .utilidades import array_alturas
 from .cubiertas import cubierta
 
@@ -25,6 +27,12 @@ AreasEdificio = namedtuple(
     'AreasEdificio', 'frente izquierda trasera derecha cubierta'
 )
 
+_PROPIEDADES_PRECALCULADAS = (
+    'areas', 'aberturas', 'alturas', 'cerramiento_condicion_1',
+    'cerramiento_condicion_2', 'cerramiento_condicion_3',
+    'cerramiento_condicion_4'
+)
+
 
 class Edificio:
     """Crea un edificio.
@@ -49,31 +57,41 @@ class Edificio:
 
     .. note:: Todos los parámetros numéricos deben ser positivos.
     """
+    __slots__ = (
+        'ancho', 'longitud', 'elevacion', 'cubierta', 'alturas_personalizadas',
+        'componentes_paredes', 'volumen_interno', '_aberturas', '_area_frontal',
+        '_cache__array_areas', '_cache__array_aberturas', '_cache_areas',
+        '_cache_aberturas', '_cache_areas_totales', '_cache_aberturas_totales',
+        '_cache_volumen', '_cache_alturas', '_cache_a0i', '_cache_agi',
+        '_cache_min_areas', '_cache_cerramiento_condicion_1',
+        '_cache_cerramiento_condicion_2', '_cache_cerramiento_condicion_3',
+        '_cache_cerramiento_condicion_4'
+    )
+
     def __init__(self, ancho, longitud, elevacion, cubierta,
                  alturas_personalizadas=None, componentes_paredes=None,
-                 volumen_interno=None, aberturas=None, **kwargs):
+                 volumen_interno=None, aberturas=None):
         self.ancho = ancho
         self.longitud = longitud
         self.elevacion = elevacion
         self.cubierta = cubierta
+        # El area de la pared frontal, igual a la de la pared trasera.
+        self._area_frontal = ancho * cubierta.altura_alero + cubierta.area_mojinete
         self.alturas_personalizadas = alturas_personalizadas
         self.componentes_paredes = componentes_paredes
         self.volumen_interno = volumen_interno or self.volumen
         self._aberturas = aberturas or [0] * 5
-
-    def _area_frontal(self):
-        """Calcula el area de la pared frontal.
-
-        :rtype: float
-        """
-        return self.ancho * self.cubierta.altura_alero + self.cubierta.area_mojinete
+        # Se calculan al crear la instancia los valores que se leen repetidamente
+        # al calcular las presiones y el cerramiento.
+        for propiedad in _PROPIEDADES_PRECALCULADAS:
+            getattr(self, propiedad)
 
     def _area_trasera(self):
         """Calcula el area de la pared trasera.
 
         :rtype: float
         """
-        return self._area_frontal()
+        return self._area_frontal
 
     def _area_derecha(self):
         """Calcula el area de la pared derecha.
@@ -90,27 +108,44 @@ class Edificio:
 
         :rtype: float or int
         """
-        if type(self.cubierta).__name__ == 'CubiertaUnAgua':
-            return self.longitud * self.cubierta.altura_cumbrera
-        return self._area_derecha()
+        return self.longitud * self.cubierta.altura_pared_izquierda
 
-    @cached_property
-    def areas(self):
-        """Retorna las areas de las paredes y el techo.
+    @propiedad_cacheada
+    def _array_areas(self):
+        """Crea un array con las areas de las paredes y el techo, en el orden de
+        :class:`AreasEdificio`.
 
-        :returns: ``namedtuple`` con las areas de las paredes y el techo.
-        :rtype: tuple
+        :rtype: :class:`~numpy:numpy.ndarray`
         """
-        areas = AreasEdificio(
-            self._area_frontal(),
+        return np.array((
+            self._area_frontal,
             self._area_izquierda(),
             self._area_trasera(),
             self._area_derecha(),
             self.cubierta.area
+        ), dtype=float)
+
+    @propiedad_cacheada
+    def _array_aberturas(self):
+        """Crea un array con las aberturas de las paredes y el techo, limitadas
+        entre cero y el area que las contiene.
+
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        return np.clip(
+            np.asarray(self._aberturas, dtype=float), 0, self._array_areas
         )
-        return areas
 
-    @cached_property
+    @propiedad_cacheada
+    def areas(self):
+        """Retorna las areas de las paredes y el techo.
+
+        :returns: ``namedtuple`` con las areas de las paredes y el techo.
+        :rtype: tuple
+        """
+        return AreasEdificio(*self._array_areas.tolist())
+
+    @propiedad_cacheada
     def aberturas(self):
         """Retorna las aberturas del edificio. Se filtran para que no sean
         menores que cero y que no sean mayores que las paredes o cubierta que las
@@ -119,29 +154,25 @@ class Edificio:
         :returns: ``namedtuple`` con las areas de las aberturas de paredes y techo.
         :rtype: tuple
         """
-        aberturas = tuple(
-            min(abertura, area) if abertura >= 0 else 0 for abertura,
-            area in zip(self._aberturas, self.areas)
-        )
-        return AreasEdificio(*aberturas)
+        return AreasEdificio(*self._array_aberturas.tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def areas_totales(self):
-        return sum(self.areas)
+        return float(self._array_areas.sum())
 
-    @cached_property
+    @propiedad_cacheada
     def aberturas_totales(self):
-        return sum(self.aberturas)
+        return float(self._array_aberturas.sum())
 
-    @cached_property
+    @propiedad_cacheada
     def volumen(self):
         """Calcula el volumen interno del edificio.
 
         :rtype: float
         """
-        return self._area_frontal() * self.longitud
+        return self._area_frontal * self.longitud
 
-    @cached_property
+    @propiedad_cacheada
     def alturas(self):
         """Crea un array de alturas desde :attr:`elevacion` a
         :attr:`altura_cumbrera`.
@@ -149,44 +180,35 @@ class Edificio:
         :returns: Un array de alturas ordenada.
         :rtype: :class:`~numpy:numpy.ndarray`
         """
-        try:
-            altura_superior = self.cubierta.altura_cumbrera
-        except AttributeError:
-            altura_superior = self.cubierta.altura_alero
         alturas = array_alturas(
-            self.elevacion, altura_superior, self.alturas_personalizadas,
-            self.cubierta.altura_alero, self.cubierta.altura_media
+            self.elevacion, self.cubierta.altura_superior,
+            self.alturas_personalizadas, self.cubierta.altura_alero,
+            self.cubierta.altura_media
         )
         return alturas
 
-    @cached_property
+    @propiedad_cacheada
     def a0i(self):
-        return tuple(
-            self.aberturas_totales - abertura for abertura in self.aberturas[:-1]
-        )
+        return tuple((self.aberturas_totales - self._array_aberturas[:-1]).tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def agi(self):
-        return tuple(
-            self.areas_totales - area for area in self.areas[:-1]
-        )
+        return tuple((self.areas_totales - self._array_areas[:-1]).tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def min_areas(self):
-        return tuple(min(0.4, 0.01 * area) for area in self.areas[:-1])
+        return tuple(np.minimum(0.4, 0.01 * self._array_areas[:-1]).tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def cerramiento_condicion_1(self):
         """Chequea para cada pared si su abertura supera el 80% del area.
 
         :returns: Tuple con booleanos para cada pared.
         """
-        return tuple(
-            abertura >= 0.8 * area for abertura, area in
-            zip(self.aberturas[:-1], self.areas[:-1])
-        )
+        condicion = self._array_aberturas[:-1] >= 0.8 * self._array_areas[:-1]
+        return tuple(condicion.tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def cerramiento_condicion_2(self):
         """Chequea si el área total de aberturas en una pared que recibe
         presión externa positiva excede la  suma  de  las  áreas  de  aberturas
@@ -195,12 +217,10 @@ class Edificio:
 
         :returns: Tuple con booleanos para cada pared.
         """
-        return tuple(
-            abertura > 1.1 * area for abertura, area in
-            zip(self.aberturas[:-1], self.a0i)
-        )
+        condicion = self._array_aberturas[:-1] > 1.1 * np.array(self.a0i)
+        return tuple(condicion.tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def cerramiento_condicion_3(self):
         """Chequea si el área total de aberturas en una pared que recibe presión
         externa positiva excede el  valor  menor  entre  0,4  m2  ó  el  1%  del
@@ -208,21 +228,18 @@ class Edificio:
 
         :returns: Tuple con booleanos para cada pared.
         """
-        return tuple(
-            abertura > area for abertura, area in
-            zip(self.aberturas[:-1], self.min_areas[:-1])
-        )
+        condicion = self._array_aberturas[:-1] > np.array(self.min_areas)
+        return tuple(condicion.tolist())
 
-    @cached_property
+    @propiedad_cacheada
     def cerramiento_condicion_4(self):
         """Chequea si el  porcentaje  de  aberturas en el resto de
         la envolvente del edificio no excede el 20%.
 
         :returns: Tuple con booleanos para cada pared.
         """
-        return tuple(
-            abertura / area <= 0.2 for abertura, area in zip(self.a0i, self.agi)
-        )
+        condicion = np.array(self.a0i) / np.array(self.agi) <= 0.2
+        return tuple(condicion.tolist())
 
     def __repr__(self):
         return f'<{self.__name__}(longitud={self.longitud}, ancho={self.ancho},' \
@@ -233,6 +250,11 @@ class Edificio:
         return 'Edificio'
 
 
+# Los argumentos aceptados por :class:`Edificio`. Se usan para descartar los
+# argumentos que corresponden a la cubierta o a otras partes de la estructura.
+_ARGS_EDIFICIO = frozenset(inspect.signature(Edificio).parameters)
+
+
 def edificio(ancho, longitud, elevacion, altura_alero, tipo_cubierta, **kwargs):
     """Construye un edificio.
 
@@ -266,6 +288,9 @@ def edificio(ancho, longitud, elevacion, altura_alero, tipo_cubierta, **kwargs):
     cubierta_edificio = cubierta(
         tipo_cubierta, ancho, longitud, altura_alero, **kwargs
     )
+    kwargs = {
+        key: valor for key, valor in kwargs.items() if key in _ARGS_EDIFICIO
+    }
     edificio = Edificio(
         ancho, longitud, elevacion, cubierta_edificio, **kwargs
     )
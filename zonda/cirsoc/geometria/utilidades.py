@@ -29,18 +29,17 @@ def array_alturas(altura_inferior, altura_superior, alturas_personalizadas=None,
     """
 
     if alturas_personalizadas is not None:
-        array_alturas = [
-            altura for altura in alturas_personalizadas if
-            altura_inferior <= altura <= altura_superior
+        array_alturas = np.asarray(alturas_personalizadas, dtype=float)
+        array_alturas = array_alturas[
+            (array_alturas >= altura_inferior) & (array_alturas <= altura_superior)
         ]
     else:
-        array_alturas = list(
-            range(math.ceil(altura_inferior), math.ceil(altura_superior) + 1, 1)
+        array_alturas = np.arange(
+            math.ceil(altura_inferior), math.ceil(altura_superior) + 1, dtype=float
         )
-    # Se añaden valores representativos en el array si no se encuentran.
-    alturas_caracteristicas = (altura_inferior, altura_superior, *otras_alturas)
-    for altura in alturas_caracteristicas:
-        if altura not in array_alturas:
-            array_alturas.append(altura)
-    array_alturas.sort()
-    return np.array(array_alturas)
\ No newline at end of file
+    # Se añaden valores representativos en el array. np.unique ordena y elimina
+    # los valores repetidos.
+    alturas_caracteristicas = np.array(
+        (altura_inferior, altura_superior, *otras_alturas), dtype=float
+    )
+    return np.unique(np.concatenate((array_alturas, alturas_caracteristicas)))
@@ -15,7 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-from collections import defaultdict
+from collections.abc import Mapping
+import numpy as np
 from .base import PresionesBase
 
 
@@ -44,18 +45,23 @@ class CubiertaAislada(PresionesBase):
         :rtype: dict.
         """
         valores_cpn = self.cpn()
-        valores = defaultdict(lambda: defaultdict(dict))
+        presion_base = self.presiones_velocidad * self.factor_rafaga
+        # Se multiplican todos los coeficientes en una única operación y luego se
+        # reparten los resultados respetando el orden de recorrido de valores_cpn.
+        cpns = [
+            valor_cpn for zonas in valores_cpn.values() for cpn in zonas.values()
+            for valor_cpn in (cpn.values() if isinstance(cpn, Mapping) else (cpn,))
+        ]
+        presiones = iter(np.multiply.outer(cpns, presion_base))
         # caso es global o local
-        for caso, zonas in valores_cpn.items():
-            for zona, cpn in zonas.items():
-                if isinstance(cpn, dict):
-                    for tipo, valor_cpn in cpn.items():
-                        valores[caso][zona][tipo] = self.presiones_velocidad * \
-                            self.factor_rafaga * valor_cpn
-                else:
-                    valores[caso][zona] = self.presiones_velocidad * \
-                        self.factor_rafaga * cpn
-        return valores
+        return {
+            caso: {
+                zona: {
+                    tipo: next(presiones) for tipo in cpn
+                } if isinstance(cpn, Mapping) else next(presiones)
+                for zona, cpn in zonas.items()
+            } for caso, zonas in valores_cpn.items()
+        }
 
     @classmethod
     def desde_cubierta(cls, cubierta, categoria, velocidad, rafaga,
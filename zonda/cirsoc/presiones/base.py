@@ -15,9 +15,71 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-import functools
-from cached_property import cached_property
+from functools import lru_cache
 import numpy as np
+from ..utilidades import propiedad_cacheada
+
+
+_FACTORES_IMPORTANCIA = {'I': 0.87, 'II': 1.0, 'III': 1.15, 'IV': 1.15}
+
+
+@lru_cache(maxsize=None)
+def _funcion_kz(constantes):
+    """Crea la función que calcula el coeficiente de exposición para una
+    categoría de exposición, con los parámetros que dependen solo de ella ya
+    resueltos.
+
+    :param constantes: Las constantes de exposición de terreno de
+        :class:`Rafaga`.
+
+    :returns: Una función que recibe la altura, que puede ser un único valor
+        númerico o de tipo :class:`~numpy:numpy.ndarray`, y retorna el
+        coeficiente de exposición para cada altura.
+    :rtype: function
+    """
+    exponente = 2 / constantes.alfa
+    inversa_zg = 1 / constantes.zg
+
+    def kz(altura):
+        # La potencia fraccionaria se calcula como exp(log(x) * p), que NumPy
+        # vectoriza mejor que una potencia general para cada elemento. Todas
+        # las etapas escriben sobre el array que crea np.maximum, por lo que
+        # no se reservan arrays intermedios.
+        valores = np.maximum(altura, 5.0)
+        if not isinstance(valores, np.ndarray):
+            return 2.01 * np.exp(np.log(valores * inversa_zg) * exponente)
+        valores *= inversa_zg
+        np.log(valores, out=valores)
+        valores *= exponente
+        np.exp(valores, out=valores)
+        valores *= 2.01
+        return valores
+
+    return kz
+
+
+def _factor_velocidad(velocidad, factor_direccionalidad, factor_importancia):
+    """Agrupa los factores escalares de la presión de velocidad.
+
+    :param float velocidad: La velocidad del viento en m/s.
+    :param float factor_direccionalidad: El factor de direccionalidad.
+    :param float factor_importancia: El factor de importancia.
+
+    :rtype: float
+    """
+    return 0.613 * factor_direccionalidad * factor_importancia * velocidad ** 2
+
+
+def _como_float64(valores):
+    """Convierte los valores a un array contiguo de tipo float64, o a float si
+    se trata de un único valor.
+
+    :param valores: Un único valor númerico o una secuencia de valores.
+    :rtype: :class:`~numpy:numpy.ndarray` o float
+    """
+    if np.ndim(valores):
+        return np.ascontiguousarray(valores, dtype=np.float64)
+    return float(valores)
 
 
 class PresionesBase:
@@ -37,26 +99,28 @@ class PresionesBase:
     :param float factor_direccionalidad: El factor de direccionalidad
         correspondiente para el tipo de estructura.
     """
+    __slots__ = (
+        'alturas', 'categoria', 'velocidad', 'rafaga', 'factor_topografico',
+        'factor_direccionalidad', 'factor_importancia', '_factor_velocidad',
+        '_cache_coeficientes_exposicion', '_cache_presiones_velocidad'
+    )
+
     def __init__(self, alturas, categoria, velocidad, rafaga, factor_topografico,
                  factor_direccionalidad):
-        self.alturas = alturas
+        self.alturas = _como_float64(alturas)
         self.categoria = categoria
         self.velocidad = velocidad
         self.rafaga = rafaga
-        self.factor_topografico = factor_topografico
+        self.factor_topografico = _como_float64(factor_topografico)
         self.factor_direccionalidad = factor_direccionalidad
+        # El factor de importancia de acuerdo a la categoría de la estructura.
+        self.factor_importancia = _FACTORES_IMPORTANCIA[categoria]
+        # Los factores escalares de la presión de velocidad.
+        self._factor_velocidad = _factor_velocidad(
+            velocidad, factor_direccionalidad, self.factor_importancia
+        )
 
-    @cached_property
-    def factor_importancia(self):
-        """Calcula el factor de importancia de acuerdo a la categoría de la
-        estructura.
-
-        :rtype: float o int
-        """
-        factores = {'I': 0.87, 'II': 1, 'III': 1.15, 'IV': 1.15}
-        return factores[self.categoria]
-
-    @cached_property
+    @propiedad_cacheada
     def coeficientes_exposicion(self):
         """Coeficiente de exposición para la presión dinámica.
 
@@ -67,38 +131,18 @@ class PresionesBase:
             retorna un float.
         :rtype: :class:`~numpy:numpy.ndarray` o float
         """
-        kz_parcial_func = functools.partial(
-            self._kz, alfa=self.rafaga.constantes_exp_terreno.alfa,
-            zg=self.rafaga.constantes_exp_terreno.zg
-        )
-        try:
-            zg_iter = (kz_parcial_func(height) for height in self.alturas)
-            return np.fromiter(zg_iter, float)
-        except TypeError:
-            return kz_parcial_func(self.alturas)
+        funcion_kz = _funcion_kz(self.rafaga.constantes_exp_terreno)
+        kz = funcion_kz(np.asarray(self.alturas))
+        return kz.item() if kz.ndim == 0 else kz
 
-    @cached_property
+    @propiedad_cacheada
     def presiones_velocidad(self):
         """Presiones de velocidad.
 
         :returns: Un array con los valores de presiones de velocidad.
         :rtype: :class:`~numpy:numpy.ndarray`
         """
-        presiones_velocidad = 0.613 * self.factor_direccionalidad * \
-            self.coeficientes_exposicion * self.factor_topografico * \
-            self.factor_importancia * self.velocidad ** 2
-        return presiones_velocidad
-
-    @staticmethod
-    def _kz(altura, alfa, zg):
-        """Calcula el coeficiente de exposición.
-
-        :param float altura: La altura a la que se calcula el coeficiente de
-            exposición.
-        :param float alfa: La constante "alfa" de exposición de terreno.
-        :param float zg: La constante "zg" de exposición de terreno.
-
-        :returns: El valor del coeficiente de exposición.
-        :rtype: float
-        """
-        return 2.01 * (max(altura, 5) / zg) ** (2 / alfa)
+        presiones = np.multiply(self.coeficientes_exposicion,
+                                self.factor_topografico)
+        presiones *= self._factor_velocidad
+        return presiones.item() if presiones.ndim == 0 else presiones
@@ -15,7 +15,31 @@
 # You should have received a copy of the GNU General Public License
 # along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
 
-from .base import PresionesBase
+import numpy as np
+from ..utilidades import propiedad_cacheada
+from .base import (
+    PresionesBase, _FACTORES_IMPORTANCIA, _factor_velocidad, _funcion_kz
+)
+
+
+# Factor de direccionalidad para carteles.
+_FACTOR_DIRECCIONALIDAD = 0.85
+
+
+def _presiones_cartel(coeficientes_exposicion, factor_topografico, factor):
+    """Calcula las presiones sobre un cartel para cada altura en un único array.
+
+    :param coeficientes_exposicion: Los coeficientes de exposición para cada
+        altura. Debe ser de tipo :class:`~numpy:numpy.ndarray`.
+    :param factor_topografico: Los factores topográficos para cada altura.
+    :param float factor: El producto de todos los factores escalares de la
+        presión.
+
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    presiones = np.multiply(coeficientes_exposicion, factor_topografico)
+    presiones *= factor
+    return presiones
 
 
 class Cartel(PresionesBase):
@@ -32,26 +56,63 @@ class Cartel(PresionesBase):
         altura de la estructura. Debe ser de tipo :class:`~numpy:numpy.ndarray`.
     :param cf: Una instancia de :class:`cp.Cartel`.
     """
+    __slots__ = (
+        'areas_parciales', 'cf', 'factor_rafaga', '_factor_presion',
+        '_cache__valores', '_cache__fuerzas_parciales'
+    )
+
     def __init__(self, alturas, areas_parciales, categoria, velocidad, rafaga,
                  factor_topografico, cf):
         super().__init__(alturas, categoria, velocidad, rafaga,
-                         factor_topografico, 0.85)
-        self.areas_parciales = areas_parciales
+                         factor_topografico, _FACTOR_DIRECCIONALIDAD)
+        self.areas_parciales = np.ascontiguousarray(areas_parciales, dtype=np.float64)
         self.cf = cf
         self.factor_rafaga = rafaga.factor
+        self._factor_presion = self._factor_velocidad * self.factor_rafaga
 
     def valores(self):
         """Calcula los valores de presión para el cartel para cada altura.
 
         :rtype: :class:`~numpy:numpy.ndarray`.
         """
-        return self.presiones_velocidad * self.factor_rafaga * self.cf()
+        return self._valores
+
+    @propiedad_cacheada
+    def _valores(self):
+        """Calcula una única vez los valores de presión para cada altura. El
+        array resultante es de solo lectura ya que se comparte entre llamadas.
+
+        :rtype: :class:`~numpy:numpy.ndarray`.
+        """
+        # Se agrupan los factores escalares para recorrer los arrays una sola vez.
+        valores = _presiones_cartel(
+            self.coeficientes_exposicion, self.factor_topografico,
+            self._factor_presion * self.cf()
+        )
+        valores.flags.writeable = False
+        return valores
 
     def fuerzas_parciales(self):
-        return self.valores()[1:] * self.areas_parciales
+        """Calcula las fuerzas sobre cada area parcial del cartel.
+
+        :rtype: :class:`~numpy:numpy.ndarray`.
+        """
+        return self._fuerzas_parciales
+
+    @propiedad_cacheada
+    def _fuerzas_parciales(self):
+        """Calcula una única vez las fuerzas sobre cada area parcial. El array
+        resultante es de solo lectura ya que se comparte entre llamadas.
+
+        :rtype: :class:`~numpy:numpy.ndarray`.
+        """
+        fuerzas = self.valores()[1:] * self.areas_parciales
+        fuerzas.flags.writeable = False
+        return fuerzas
 
     def fuerza_total(self):
-        return sum(self.fuerzas_parciales())
+        # Producto escalar entre presiones y areas, sin crear el array de fuerzas.
+        return float(np.dot(self.valores()[1:], self.areas_parciales))
 
     @classmethod
     def desde_cartel(cls, cartel, categoria, velocidad, rafaga,
@@ -70,5 +131,56 @@ class Cartel(PresionesBase):
         return cls(cartel.alturas, cartel.areas_parciales, categoria, velocidad,
                    rafaga, factor_topografico, cf)
 
+    @classmethod
+    def valores_lote(cls, alturas, categoria, velocidad, rafaga,
+                     factor_topografico, cf):
+        """Calcula los valores de presión para varios carteles a la vez, sin
+        crear una instancia por cada uno.
+
+        Todos los carteles comparten la categoría, la velocidad y la ráfaga,
+        por lo que la exposición de terreno es la misma para todos.
+
+        :param alturas: Las alturas de cada cartel. Debe ser de tipo
+            :class:`~numpy:numpy.ndarray` de forma (cantidad de carteles,
+            cantidad de alturas).
+        :param str categoria: La categoría de las estructuras. Valores
+            aceptados = (I, II, III, IV)
+        :param float velocidad: La velocidad del viento en m/s.
+        :param rafaga: Una instancia de :class:`Rafaga`.
+        :param factor_topografico: Los factores topográficos. Puede ser un
+            único valor númerico o un :class:`~numpy:numpy.ndarray` con la
+            misma forma que las alturas.
+        :param cf: El coeficiente de fuerza de cada cartel. Puede ser un único
+            valor númerico o una secuencia con un valor por cartel.
+
+        :returns: Un array con los valores de presión de cada cartel en cada
+            fila.
+        :raises ValueError: Si las alturas no son un array de dos dimensiones,
+            si los factores topográficos no pueden extenderse a su forma o si
+            no hay un único cf o uno por cartel.
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        alturas = np.asarray(alturas, dtype=np.float64)
+        if alturas.ndim != 2:
+            raise ValueError(
+                'Las alturas deben tener forma (cantidad de carteles, '
+                'cantidad de alturas)'
+            )
+        cf = np.asarray(cf, dtype=np.float64)
+        if cf.ndim and cf.shape != alturas.shape[:1]:
+            raise ValueError('Se debe indicar un único cf o uno por cartel')
+        # Falla si los factores topográficos no se extienden a las alturas, por
+        # lo que el resultado siempre tiene la forma de las alturas.
+        factor_topografico = np.broadcast_to(factor_topografico, alturas.shape)
+        kz = _funcion_kz(rafaga.constantes_exp_terreno)(alturas)
+        # Mismo orden de factores que en una instancia, para obtener los mismos
+        # valores.
+        factor = _factor_velocidad(
+            velocidad, _FACTOR_DIRECCIONALIDAD, _FACTORES_IMPORTANCIA[categoria]
+        ) * rafaga.factor * cf
+        if factor.ndim:
+            factor = factor[:, np.newaxis]
+        return _presiones_cartel(kz, factor_topografico, factor)
+
     def __call__(self):
         return self.valores()
@@ -17,7 +17,8 @@
 
 import functools
 from collections import namedtuple, defaultdict
-from cached_property import cached_property
+from collections.abc import Mapping
+from functools import cached_property
 from .base import PresionesBase
 
 
@@ -152,10 +153,10 @@ class CubiertaSprfvMetodoDireccional(PresionesBase):
             de cp y de rafaga. Ver el método "valores".
         """
         presiones = {}
-        if not isinstance(cp, dict):
+        if not isinstance(cp, Mapping):
             return func(cp=cp, factor_rafaga=factor_rafaga)
         for key, valor in cp.items():
-            if isinstance(valor, dict):
+            if isinstance(valor, Mapping):
                 presiones[key] = self._calcular_presiones(
                     valor, factor_rafaga, func
                 )
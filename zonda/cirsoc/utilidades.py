@@ -0,0 +1,39 @@
+# Copyright (c) 2019, Eduardo Di Loreto <efdiloreto@gmail.com>
+
+# This file is part of Zonda.
+
+# Zonda is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# Zonda is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Zonda.  If not, see <https://www.gnu.org/licenses/>.
+
+
+class propiedad_cacheada:
+    """Decorador equivalente a :func:`functools.cached_property` para clases con
+    ``__slots__``. El valor calculado se guarda en el slot ``_cache_<nombre>``,
+    que debe estar declarado en la clase.
+    """
+    def __init__(self, funcion):
+        self.funcion = funcion
+        self.__doc__ = funcion.__doc__
+
+    def __set_name__(self, owner, nombre):
+        self.slot = f'_cache_{nombre}'
+
+    def __get__(self, instancia, owner=None):
+        if instancia is None:
+            return self
+        try:
+            return getattr(instancia, self.slot)
+        except AttributeError:
+            valor = self.funcion(instancia)
+            setattr(instancia, self.slot, valor)
+            return valor